@@ -0,0 +1,108 @@
+#
+#
+# Title:        cell_addressing.py
+# Author:       bRiggin
+#
+#
+
+#
+# imports
+#
+
+import os
+import sys
+import time
+import logging
+import openpyxl
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import translation_strings_tool as tool
+
+ROWS = 100000
+COLUMN_LOOKUPS = 1000000
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def string_coordinate_write(worksheet, rows):
+    """ String Coordinate Write
+
+    Writes four cells per row the way populate_cell used to, by formatting and assigning an "A1" style coordinate.
+
+    :param worksheet:   openPyXl worksheet.
+    :param rows:        Number of rows to write.
+    """
+    for row in range(2, rows + 2):
+        worksheet["A{}".format(row)] = "string"
+        worksheet["B{}".format(row)] = "b,i"
+        worksheet["C{}".format(row)] = "key"
+        worksheet["D{}".format(row)] = "value"
+
+
+def integer_write(worksheet, rows):
+    """ Integer Write
+
+    Writes four cells per row through populate_cell, which addresses cells by integer row and column.
+
+    :param worksheet:   openPyXl worksheet.
+    :param rows:        Number of rows to write.
+    """
+    for row in range(2, rows + 2):
+        for cell_type, value in zip(tool.CellType, ("string", "b,i", "key", "value")):
+            tool.populate_cell(worksheet, row, cell_type, value)
+
+
+def computed_column_value(index):
+    """ Computed Column Value
+
+    The quotient and remainder calculation get_column_value used before the lookup table, valid up to column ZZ.
+
+    :param index:   Zero based column index.
+    :return:        Excel column letters.
+    """
+    column_value = ""
+    result = index // len(ALPHABET)
+    if result > 0:
+        column_value += ALPHABET[result - 1]
+    column_value += ALPHABET[index % len(ALPHABET)]
+    return column_value
+
+
+def time_function(function, *arguments):
+    """ Time Function
+
+    :param function:    Function to time.
+    :param arguments:   Arguments passed to the function.
+    :return:            Elapsed wall time in seconds.
+    """
+    start = time.perf_counter()
+    function(*arguments)
+    return time.perf_counter() - start
+
+
+def time_lookups(function):
+    """ Time Lookups
+
+    :param function:    Column letter function, called with indices cycling through the first 702 (A..ZZ) columns.
+    :return:            Elapsed wall time in seconds.
+    """
+    start = time.perf_counter()
+    for index in range(COLUMN_LOOKUPS):
+        function(index % 702)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    tool.logger.setLevel(logging.WARNING)
+    cells = ROWS * 4
+
+    print("{:<26} {:>10} {:>14}".format("method", "seconds", "ns per cell"))
+    for name, write in [("string coordinates", string_coordinate_write), ("integer row/column", integer_write)]:
+        elapsed = time_function(write, openpyxl.Workbook().active, ROWS)
+        print("{:<26} {:>10.3f} {:>14.0f}".format(name, elapsed, elapsed / cells * 1e9))
+
+    print("\n{:<26} {:>10} {:>14}".format("method", "seconds", "ns per lookup"))
+    for name, function in [("computed column letters", computed_column_value),
+                           ("column letter table", tool.get_column_value)]:
+        elapsed = time_lookups(function)
+        print("{:<26} {:>10.3f} {:>14.0f}".format(name, elapsed, elapsed / COLUMN_LOOKUPS * 1e9))
@@ -0,0 +1,78 @@
+#
+#
+# Title:        construct_scaling.py
+# Author:       bRiggin
+#
+#
+
+#
+# imports
+#
+
+import os
+import sys
+import time
+import logging
+import openpyxl
+import xml.etree.ElementTree as elementTree
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import translation_strings_tool as tool
+
+ROW_COUNTS = [1000, 10000, 100000]
+
+
+def build_worksheet(rows):
+    """ Build Worksheet
+
+    Creates an in-memory worksheet laid out like a deconstructed strings.xml file, with a mixture of strings,
+    modified strings, string-arrays and plurals.
+
+    :param rows:        Approximate number of worksheet rows to create (each group of four elements spans nine rows).
+    :return worksheet:  Populated openPyXl worksheet.
+    """
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.append(["XML Element Type", "String Style Modifiers", "XML Element Key", "English"])
+    index = 0
+    while index * 9 < rows * 4:
+        if index % 4 == 0:
+            worksheet.append(["string-array", None, "array_{}".format(index)])
+            for item in range(3):
+                worksheet.append(["item", None, None, "Array item {}".format(item)])
+        elif index % 4 == 1:
+            worksheet.append(["plurals", None, "plural_{}".format(index)])
+            worksheet.append(["item", None, "one", "One thing"])
+            worksheet.append(["item", "b,u", "other", "Many things"])
+        elif index % 4 == 2:
+            worksheet.append(["string", "b,i", "styled_{}".format(index), "Styled string {}".format(index)])
+        else:
+            worksheet.append(["string", None, "string_{}".format(index), "Plain string {}".format(index)])
+        index += 1
+    return worksheet
+
+
+def time_construction(worksheet):
+    """ Time Construction
+
+    Times reading the rows of the parsed worksheet, then building and serialising its first language column.
+
+    :param worksheet:   Populated openPyXl worksheet.
+    :return:            Elapsed wall time in seconds.
+    """
+    start = time.perf_counter()
+    sheet_data = tool.read_worksheet_rows(worksheet)
+    xml_tree = tool.build_xml_tree(sheet_data.rows, 0, elementTree.Element('resources'))
+    elementTree.tostring(xml_tree)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    tool.logger.setLevel(logging.WARNING)
+    print("{:>10} {:>12} {:>14}".format("rows", "seconds", "us per row"))
+    for row_count in ROW_COUNTS:
+        sheet = build_worksheet(row_count)
+        element_rows = sheet.max_row - 1
+        elapsed = time_construction(sheet)
+        print("{:>10} {:>12.3f} {:>14.2f}".format(element_rows, elapsed, elapsed / element_rows * 1e6))
@@ -0,0 +1,148 @@
+#
+#
+# Title:        modifier_codec.py
+# Author:       bRiggin
+#
+#
+
+#
+# imports
+#
+
+import os
+import sys
+import time
+import logging
+import xml.etree.ElementTree as elementTree
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import translation_strings_tool as tool
+
+ROWS = 20000
+DEPTHS = [1, 2, 4, 8, 16]
+MODIFIERS = ["b", "i", "u"]
+TEXT = "Deeply styled UI string with a %1$s placeholder."
+
+
+def previous_derive_modifiers_and_string(item):
+    """ Previous Derive Modifiers and String
+
+    The modifier chain walk derive_modifiers_and_string used before the single pass decoder, which copied the
+    children of every level into a list to find the deepest one.
+
+    :param item:    Parsed XML element.
+    :return:        Tuple of modifier tags and the UI string.
+    """
+    modifiers = []
+    current_level = item
+    while len(list(current_level)) != 0:
+        current_level = current_level[0]
+        modifiers.append(current_level.tag)
+    return tuple(modifiers), current_level.text
+
+
+def previous_create_modified_element(element_type, modifiers, key, text):
+    """ Previous Create Modified Element
+
+    The nesting create_modified_element used before the single pass encoder, which listed every element of the chain
+    built so far to find where to add the next modifier.
+
+    :param element_type:    The type of XML element that is being created.
+    :param modifiers:       Tuple of modifier tags, outermost first.
+    :param key:             The key that should be used in element.
+    :param text:            The UI value of element.
+    :return:                The XML element.
+    """
+    base_element = elementTree.Element(element_type)
+    base_element.set("name", key)
+    number_of_modifiers = len(modifiers)
+    count = 1
+    for modifier in modifiers:
+        if number_of_modifiers == 1:
+            modifier_element = elementTree.Element(modifier)
+            modifier_element.text = text
+        elif count == 1:
+            modifier_element = elementTree.Element(modifier)
+        elif count == number_of_modifiers:
+            child_element_list = list(modifier_element.iter())
+            last_element = elementTree.Element(modifier)
+            last_element.text = text
+            child_element_list.pop(len(child_element_list) - 1).append(last_element)
+        else:
+            child_element_list = list(modifier_element.iter())
+            elementTree.SubElement(child_element_list.pop(len(child_element_list) - 1), modifier)
+        count += 1
+    base_element.append(modifier_element)
+    return base_element
+
+
+def create_styled_elements(depth, rows):
+    """ Create Styled Elements
+
+    :param depth:   Number of nested modifiers around each string's text.
+    :param rows:    Number of string elements to create.
+    :return:        List of parsed string elements.
+    """
+    modifiers = tuple(MODIFIERS[index % len(MODIFIERS)] for index in range(depth))
+    return [tool.create_modified_element("string", modifiers, "string_{}".format(row), TEXT) for row in range(rows)]
+
+
+def create_markup_elements(rows):
+    """ Create Markup Elements
+
+    :param rows:    Number of string elements to create.
+    :return:        List of parsed string elements with text beside their modifiers.
+    """
+    return [elementTree.fromstring('<string name="markup_{}">Tap <b>here</b> or <a href="https://example.com">'
+                                   '<i>there</i></a> to continue.</string>'.format(row)) for row in range(rows)]
+
+
+def time_decode(function, elements):
+    """ Time Decode
+
+    :param function:    Function given each element, returning its modifiers and text.
+    :param elements:    Parsed string elements.
+    :return:            Elapsed wall time in seconds.
+    """
+    start = time.perf_counter()
+    for element in elements:
+        function(element)
+    return time.perf_counter() - start
+
+
+def time_encode(function, decoded):
+    """ Time Encode
+
+    :param function:    Function given the element type, modifiers, key and text, returning the element.
+    :param decoded:     List of (modifiers, text) tuples.
+    :return:            Elapsed wall time in seconds.
+    """
+    start = time.perf_counter()
+    for modifiers, text in decoded:
+        function("string", modifiers, "key", text)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    tool.logger.setLevel(logging.WARNING)
+
+    print("{:>8} {:<10} {:>12} {:>12} {:>9}".format("depth", "direction", "previous us", "current us", "speed up"))
+    for modifier_depth in DEPTHS:
+        styled_elements = create_styled_elements(modifier_depth, ROWS)
+        decoded_rows = [tool.derive_modifiers_and_string(element) for element in styled_elements]
+        for direction, previous, current in [
+                ("decode", time_decode(previous_derive_modifiers_and_string, styled_elements),
+                 time_decode(tool.derive_modifiers_and_string, styled_elements)),
+                ("encode", time_encode(previous_create_modified_element, decoded_rows),
+                 time_encode(tool.create_modified_element, decoded_rows))]:
+            print("{:>8} {:<10} {:>12.2f} {:>12.2f} {:>8.1f}x".format(modifier_depth, direction, previous / ROWS * 1e6,
+                                                                    current / ROWS * 1e6, previous / current))
+
+    # Mixed text and modifiers were previously reduced to the first modifier chain's text, so there is no comparison.
+    markup_elements = create_markup_elements(ROWS)
+    decoded_rows = [tool.derive_modifiers_and_string(element) for element in markup_elements]
+    print("\n{:<26} {:>12}".format("markup", "current us"))
+    print("{:<26} {:>12.2f}".format("decode", time_decode(tool.derive_modifiers_and_string, markup_elements) /
+                                    ROWS * 1e6))
+    print("{:<26} {:>12.2f}".format("encode", time_encode(tool.create_modified_element, decoded_rows) / ROWS * 1e6))
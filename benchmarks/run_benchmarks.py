@@ -0,0 +1,178 @@
+#
+#
+# Title:        run_benchmarks.py
+# Author:       bRiggin
+#
+#
+
+#
+# imports
+#
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+import openpyxl
+import xml.etree.ElementTree as elementTree
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import translation_strings_tool as tool
+from strings_generator import generate_strings_xml, add_language_columns
+
+#
+# args
+#
+parser = argparse.ArgumentParser(prog="Android Translation Strings Tool benchmarks",
+                                 description="Times each stage of deconstruction and construction against synthetic "
+                                             "strings.xml files and optionally compares the results to a baseline.")
+parser.add_argument("-n", "--sizes", type=int, nargs="+", default=[1000, 10000],
+                    help="Numbers of top-level elements to benchmark, e.g. 1000 10000 100000 1000000.")
+parser.add_argument("-l", "--languages", type=int, default=5, help="Number of language columns to construct.")
+parser.add_argument("--modifier-depth", type=int, default=2, help="Maximum depth of nested modifiers.")
+parser.add_argument("--style", choices=[tool.STYLE_NONE, tool.STYLE_FAST, tool.STYLE_FULL], default=tool.STYLE_FULL,
+                    help="Style level passed to style_worksheet.")
+parser.add_argument("-o", "--output", type=str, default=None, help="Write results to this JSON file.")
+parser.add_argument("-b", "--baseline", type=str, default=None,
+                    help="Compare results to this JSON file, exiting with 1 if any stage regressed.")
+parser.add_argument("-t", "--tolerance", type=float, default=0.25,
+                    help="Allowed slowdown against the baseline before a stage counts as a regression (0.25 = 25%%).")
+
+
+def timed(results, elements, stage, rows, function, *arguments):
+    """ Timed
+
+    Calls the function and records its wall time against the stage.
+
+    :param results:     List the result dictionary is appended to.
+    :param elements:    Number of top-level elements being benchmarked.
+    :param stage:       Name of the stage.
+    :param rows:        Number of worksheet rows the stage processes.
+    :param function:    Function to time.
+    :param arguments:   Arguments passed to the function.
+    :return:            The function's return value.
+    """
+    start = time.perf_counter()
+    value = function(*arguments)
+    seconds = time.perf_counter() - start
+    results.append({"elements": elements, "stage": stage, "seconds": round(seconds, 6), "rows": rows,
+                    "rows_per_second": round(rows / seconds, 1) if seconds > 0 else None})
+    print("{:>10} {:<20} {:>10.3f}s {:>12.0f} rows/s".format(elements, stage, seconds, rows / max(seconds, 1e-9)))
+    return value
+
+
+def build_languages(sheet_data, directories):
+    """ Build Languages
+
+    Builds and saves the strings.xml file of every language.
+
+    :param sheet_data:      SheetData read from the worksheet.
+    :param directories:     The output directory of each language.
+    """
+    for language_index, directory in enumerate(directories):
+        tool.create_xml_file(sheet_data, language_index, elementTree.Element('resources'), directory)
+
+
+def benchmark_size(results, elements, languages, modifier_depth, style, work_path):
+    """ Benchmark Size
+
+    Runs every stage against a generated strings.xml file with the given number of elements.
+
+    :param results:         List that results are appended to.
+    :param elements:        Number of top-level elements to generate.
+    :param languages:       Number of language columns to construct.
+    :param modifier_depth:  Maximum depth of nested modifiers.
+    :param style:           Style level passed to style_worksheet.
+    :param work_path:       Scratch directory.
+    """
+    source_path = os.path.join(work_path, str(elements))
+    rows = generate_strings_xml(source_path, elements, modifier_depth=modifier_depth)
+
+    xml_elements = timed(results, elements, "read_xml_file", rows, tool.read_xml_file, source_path)
+
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = tool.WORKSHEET_TITLE
+    column_lengths = timed(results, elements, "populate_worksheet", rows, tool.populate_worksheet, xml_elements,
+                           worksheet)
+    del xml_elements
+
+    add_language_columns(worksheet, languages)
+    timed(results, elements, "style_worksheet", rows, tool.style_worksheet, worksheet, style, tool.HEADINGS,
+          column_lengths)
+
+    timed(results, elements, "workbook_save", rows, workbook.save, os.path.join(source_path, "benchmark.xlsx"))
+    del workbook, worksheet
+
+    def load():
+        loaded_workbook = tool.read_excel_file(source_path, "benchmark.xlsx")
+        data = tool.read_worksheet_rows(tool.get_excel_worksheet(loaded_workbook, tool.WORKSHEET_TITLE))
+        loaded_workbook.close()
+        return data
+
+    sheet_data = timed(results, elements, "workbook_load", rows, load)
+
+    directories = tool.create_folders(sheet_data.languages, source_path, os.path.join(source_path, "constructed"))
+    timed(results, elements, "create_xml_file", rows * len(directories), build_languages, sheet_data, directories)
+
+    shutil.rmtree(source_path)
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """ Compare to Baseline
+
+    Prints the change in wall time of each stage against the baseline.
+
+    :param results:     Current results.
+    :param baseline:    Results loaded from the baseline JSON file.
+    :param tolerance:   Allowed slowdown before a stage counts as a regression.
+    :return:            List of (elements, stage) that regressed.
+    """
+    baseline_seconds = {(result["elements"], result["stage"]): result["seconds"] for result in baseline["results"]}
+    regressions = []
+    print("\n{:>10} {:<20} {:>10} {:>10} {:>9}".format("elements", "stage", "baseline", "current", "change"))
+    for result in results:
+        key = (result["elements"], result["stage"])
+        if key not in baseline_seconds or baseline_seconds[key] <= 0:
+            continue
+        change = result["seconds"] / baseline_seconds[key] - 1
+        flag = "  REGRESSION" if change > tolerance else ""
+        print("{:>10} {:<20} {:>9.3f}s {:>9.3f}s {:>+8.1%}{}".format(key[0], key[1], baseline_seconds[key],
+                                                                       result["seconds"], change, flag))
+        if change > tolerance:
+            regressions.append(key)
+    return regressions
+
+
+if __name__ == '__main__':
+    arguments = parser.parse_args()
+    tool.logger.setLevel(logging.WARNING)
+
+    benchmark_results = []
+    scratch_path = tempfile.mkdtemp(prefix="strings_benchmark_")
+    try:
+        print("{:>10} {:<20} {:>11} {:>17}".format("elements", "stage", "time", "throughput"))
+        for size in arguments.sizes:
+            benchmark_size(benchmark_results, size, arguments.languages, arguments.modifier_depth, arguments.style,
+                           scratch_path)
+    finally:
+        shutil.rmtree(scratch_path, ignore_errors=True)
+
+    report = {"environment": {"python": platform.python_version(), "openpyxl": openpyxl.__version__,
+                              "platform": platform.platform()},
+              "languages": arguments.languages, "style": arguments.style, "results": benchmark_results}
+
+    if arguments.output is not None:
+        with open(arguments.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if arguments.baseline is not None:
+        with open(arguments.baseline, 'r', encoding='utf-8') as baseline_file:
+            if compare_to_baseline(benchmark_results, json.load(baseline_file), arguments.tolerance):
+                sys.exit(1)
@@ -0,0 +1,137 @@
+#
+#
+# Title:        strings_generator.py
+# Author:       bRiggin
+#
+#
+
+#
+# imports
+#
+
+import os
+import random
+import argparse
+import xml.etree.ElementTree as elementTree
+
+MODIFIERS = ["b", "i", "u"]
+PLURAL_QUANTITIES = ["zero", "one", "two", "few", "many", "other"]
+WORDS = ["account", "settings", "message", "retry", "cancel", "download", "profile", "search", "network", "error",
+         "upload", "photo", "friend", "share", "notification", "privacy", "update", "storage", "help", "welcome"]
+
+#
+# args
+#
+parser = argparse.ArgumentParser(prog="strings.xml generator",
+                                 description="Generates a realistic, synthetic strings.xml file for benchmarking.")
+parser.add_argument("path", type=str, help="Directory the strings.xml file is written to.")
+parser.add_argument("-n", "--elements", type=int, default=1000, help="Total number of top-level elements.")
+parser.add_argument("--array-share", type=float, default=0.1, help="Share of elements that are string-arrays.")
+parser.add_argument("--plurals-share", type=float, default=0.1, help="Share of elements that are plurals.")
+parser.add_argument("--modified-share", type=float, default=0.2, help="Share of strings and items with modifiers.")
+parser.add_argument("--modifier-depth", type=int, default=2, help="Maximum depth of nested modifiers.")
+parser.add_argument("--array-items", type=int, default=5, help="Number of items in each string-array.")
+parser.add_argument("--seed", type=int, default=0, help="Random seed, the same seed always gives the same file.")
+
+
+def generate_text(rng):
+    """ Generate Text
+
+    :param rng: random.Random instance.
+    :return:    A short sentence of random words, some with an Android placeholder.
+    """
+    words = [rng.choice(WORDS) for _ in range(rng.randint(1, 8))]
+    if rng.random() < 0.2:
+        words.insert(rng.randint(0, len(words)), "%1$s")
+    sentence = " ".join(words)
+    return sentence[0].upper() + sentence[1:] + "."
+
+
+def add_text(rng, element, modified_share, modifier_depth):
+    """ Add Text
+
+    Gives the element its text, nested within one or more modifier elements for the configured share of elements.
+
+    :param rng:             random.Random instance.
+    :param element:         The string or item element.
+    :param modified_share:  Share of elements given modifiers.
+    :param modifier_depth:  Maximum depth of nested modifiers.
+    """
+    if modifier_depth > 0 and rng.random() < modified_share:
+        for _ in range(rng.randint(1, modifier_depth)):
+            element = elementTree.SubElement(element, rng.choice(MODIFIERS))
+    element.text = generate_text(rng)
+
+
+def generate_strings_xml(path, elements=1000, array_share=0.1, plurals_share=0.1, modified_share=0.2,
+                         modifier_depth=2, array_items=5, seed=0):
+    """ Generate strings.xml
+
+    Writes a synthetic strings.xml file containing the requested mix of strings, string-arrays and plurals.
+
+    :param path:            Directory the strings.xml file is written to.
+    :param elements:        Total number of top-level elements.
+    :param array_share:     Share of elements that are string-arrays.
+    :param plurals_share:   Share of elements that are plurals.
+    :param modified_share:  Share of strings and items with modifiers.
+    :param modifier_depth:  Maximum depth of nested modifiers.
+    :param array_items:     Number of items in each string-array.
+    :param seed:            Random seed.
+    :return rows:           Number of worksheet rows the file deconstructs into.
+    """
+    rng = random.Random(seed)
+    if not os.path.exists(path):
+        os.makedirs(path)
+
+    rows = 0
+    with open(os.path.join(path, "strings.xml"), 'w', encoding='utf-8') as file:
+        file.write('<?xml version="1.0" encoding="utf-8"?>\n<resources>\n')
+        for index in range(elements):
+            choice = rng.random()
+            if choice < array_share:
+                element = elementTree.Element("string-array", name="array_{}".format(index))
+                for _ in range(array_items):
+                    add_text(rng, elementTree.SubElement(element, "item"), modified_share, modifier_depth)
+                rows += array_items + 1
+            elif choice < array_share + plurals_share:
+                element = elementTree.Element("plurals", name="plurals_{}".format(index))
+                for quantity in PLURAL_QUANTITIES:
+                    add_text(rng, elementTree.SubElement(element, "item", quantity=quantity), modified_share,
+                             modifier_depth)
+                rows += len(PLURAL_QUANTITIES) + 1
+            else:
+                element = elementTree.Element("string", name="string_{}".format(index))
+                add_text(rng, element, modified_share, modifier_depth)
+                rows += 1
+            file.write("    ")
+            file.write(elementTree.tostring(element, encoding="unicode"))
+            file.write("\n")
+        file.write("</resources>\n")
+    return rows
+
+
+def add_language_columns(worksheet, languages):
+    """ Add Language Columns
+
+    Fills the given number of language columns after the English column (D) with pseudo-translations of it, in the
+    way translators populate a deconstructed spreadsheet.
+
+    :param worksheet:   Populated openPyXl worksheet.
+    :param languages:   Number of languages in total, including English.
+    """
+    for row in worksheet.iter_rows(min_row=1, max_col=4 + languages - 1):
+        english = row[3].value
+        for language in range(1, languages):
+            if row[0].row == 1:
+                row[3 + language].value = "Language {}".format(language + 1)
+            elif english is not None:
+                row[3 + language].value = "[{}] {}".format(language + 1, english)
+
+
+if __name__ == '__main__':
+    arguments = parser.parse_args()
+    generated_rows = generate_strings_xml(arguments.path, arguments.elements, arguments.array_share,
+                                          arguments.plurals_share, arguments.modified_share,
+                                          arguments.modifier_depth, arguments.array_items, arguments.seed)
+    print("strings.xml with {} elements ({} worksheet rows) written to: {}".
+          format(arguments.elements, generated_rows, arguments.path))
@@ -11,17 +11,30 @@
 # imports
 #
 
-import openpyxl
 import logging
 import argparse
 import sys
 import os
 import traceback
-import math
+import csv
+import re
+import json
+import time
+import hashlib
+import marshal
+import zlib
+import functools
+import itertools
 import xml.etree.ElementTree as elementTree
-import xml.dom.minidom as minidom
-from openpyxl.styles import Alignment, PatternFill, Border, Side, Font
 from enum import Enum
+from copy import copy
+from collections import namedtuple
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, peak memory is then left out of the metrics report.
+    resource = None
 
 
 class CellType(Enum):
@@ -36,48 +49,376 @@ class CellType(Enum):
     string = 3
 
 
+class TranslationStringsError(Exception):
+    """ TranslationStringsError
+
+    Base class of the errors raised by the tool, the message describes what failed. Raised in place of exiting, so that
+    the tool can be used in-process as a library as well as from the command line.
+    """
+
+
+class SourceFileError(TranslationStringsError):
+    """ SourceFileError
+
+    The strings.xml file or spreadsheet being read is unreadable, incorrectly formatted or could not be processed.
+    """
+
+
+class SourceNotFoundError(SourceFileError):
+    """ SourceNotFoundError
+
+    The strings.xml file or spreadsheet being read does not exist.
+    """
+
+
+class OutputFileError(TranslationStringsError):
+    """ OutputFileError
+
+    An output file or directory could not be written.
+    """
+
+
+class ConstructionError(TranslationStringsError):
+    """ ConstructionError
+
+    One or more languages or batch modules failed, after every one of them had been attempted.
+    """
+
+    def __init__(self, message, failed=()):
+        super().__init__(message)
+        self.failed = list(failed)
+
+
+class StageMetrics:
+    """ StageMetrics
+
+    Collects the wall time and rows processed of each stage of a run, for the --metrics report, along with the peak
+    resident memory of the process once the stage had run. That peak is the process's high-water mark rather than the
+    stage's own use, so every stage after the most memory hungry one reports the same value. Stages may be nested
+    (create_xml_file includes save_xml_file), so their times are not additive.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.stages = {}
+
+    def record(self, stage, seconds, rows):
+        """ Record
+
+        :param stage:   Name of the stage.
+        :param seconds: Wall time spent in the stage.
+        :param rows:    Number of rows processed by the stage.
+        """
+        entry = self.stages.setdefault(stage, {"calls": 0, "seconds": 0.0, "rows": 0})
+        entry["calls"] += 1
+        entry["seconds"] += seconds
+        entry["rows"] += rows
+        entry["process_peak_memory_mb"] = get_peak_memory_mb()
+
+    def take(self):
+        """ Take
+
+        Returns the stages recorded so far and starts afresh, used to hand a worker process's metrics back.
+
+        :return stages: Dictionary of stage name to its totals.
+        """
+        stages = self.stages
+        self.stages = {}
+        return stages
+
+    def merge(self, stages):
+        """ Merge
+
+        Adds stages recorded by a worker process. Worker times are summed, so may exceed the run's wall time, and the
+        process peak is the highest of any process that ran the stage.
+
+        :param stages:  Dictionary returned by take().
+        """
+        for stage, other in stages.items():
+            entry = self.stages.setdefault(stage, {"calls": 0, "seconds": 0.0, "rows": 0})
+            entry["calls"] += other["calls"]
+            entry["seconds"] += other["seconds"]
+            entry["rows"] += other["rows"]
+            entry["process_peak_memory_mb"] = max(entry.get("process_peak_memory_mb") or 0,
+                                                  other.get("process_peak_memory_mb") or 0) or None
+
+    def report(self, mode):
+        """ Report
+
+        :param mode:    Mode the run was made in.
+        :return:        Machine-readable dictionary of the run's metrics.
+        """
+        stages = []
+        for stage, entry in self.stages.items():
+            seconds = entry["seconds"]
+            stages.append({"stage": stage, "calls": entry["calls"], "seconds": round(seconds, 6), "rows": entry["rows"],
+                           "rows_per_second": round(entry["rows"] / seconds, 1) if seconds > 0 and entry["rows"]
+                           else None,
+                           "process_peak_memory_mb": entry["process_peak_memory_mb"]})
+        return {"mode": mode, "total_seconds": round(time.perf_counter() - self.started, 6),
+                "peak_memory_mb": get_peak_memory_mb(), "stages": stages}
+
+
+class ProgressReporter:
+    """ ProgressReporter
+
+    Logs the progress of a long stage: rows done, rows per second and, when the total is known, the time remaining.
+    Callers only call update once their row count passes next_check, so the clock is read once every check_rows rows,
+    and a line is logged at most once every PROGRESS_INTERVAL seconds, so stages quicker than that log nothing.
+    """
+    def __init__(self, stage, total=None, check_rows=None):
+        self.stage = stage
+        self.total = total
+        self.check_rows = check_rows or PROGRESS_CHECK_ROWS
+        self.next_check = self.check_rows
+        self.started = time.monotonic()
+        self.reported = self.started
+
+    def update(self, done):
+        """ Update
+
+        :param done:    Number of rows done so far.
+        """
+        self.next_check = done + self.check_rows
+        now = time.monotonic()
+        if now - self.reported < PROGRESS_INTERVAL:
+            return
+        self.reported = now
+        rate = done / (now - self.started)
+        if self.total:
+            minutes, seconds = divmod(int((self.total - done) / rate) if rate > 0 else 0, 60)
+            logger.info("{}: {}/{} rows ({:.0%}), {:.0f} rows/s, ETA {}m {:02d}s".
+                        format(self.stage, done, self.total, done / self.total, rate, minutes, seconds))
+        else:
+            logger.info("{}: {} rows, {:.0f} rows/s".format(self.stage, done, rate))
+
+
+# One record per worksheet row, used in both directions. element_type and modifiers are interned, modifiers being a
+# shared tuple of modifier tags (see decode_modifiers) or None, and values holds the text of each language. Rows read
+# from a spreadsheet also hold the name of the sheet (or file) and the row number they were read from, so that
+# problems can be reported against the row the user sees. Rows decoded from strings.xml leave both None.
+SheetRow = namedtuple("SheetRow", ["element_type", "modifiers", "key", "values", "sheet", "row"])
+SheetRow.__new__.__defaults__ = (None, None)
+SheetData = namedtuple("SheetData", ["languages", "rows"])
+BatchModule = namedtuple("BatchModule", ["name", "res_path", "values_directories"])
+DeconstructionResult = namedtuple("DeconstructionResult", ["file_path", "rows"])
+ConstructionResult = namedtuple("ConstructionResult", ["languages", "directories", "constructed", "skipped"])
+ValidationIssue = namedtuple("ValidationIssue", ["kind", "row", "key", "language", "detail", "sheet"])
+ValidationResult = namedtuple("ValidationResult", ["languages", "rows", "issues"])
+# Translations read from the values-*/strings.xml files beside the base file, see read_locale_columns. Each index maps
+# a row identity (see identify_rows) to that locale's (modifiers, text).
+LocaleColumns = namedtuple("LocaleColumns", ["languages", "indices"])
+
 DESTINATION_STRING_NOT_DEFINED = "!mp@$$!&L£|P@+h"
 XML_TITLE = "strings.xml"
 WORKSHEET_TITLE = "Deconstructed Strings"
+FIRST_LANGUAGE_COLUMN = 3
+MAX_COLUMNS = 16384
+HEADINGS = ["XML Element Type", "String Style Modifiers", "XML Element Key", "English", "French", "Spanish"]
+FIXED_COLUMN_WIDTHS = [18, 24, 40]
+LANGUAGE_COLUMN_WIDTH = 50
+# Language columns up to this one (AD) are sized and wrapped by adjust_column_width even when empty, ready for new
+# languages to be pasted in.
+LAST_STYLED_COLUMN = 30
+HEADING_COLOUR = "90CAF9"
+FILL_COLOUR = "BBDEFB"
+BASE_VALUES_DIRECTORY = "values"
+# Locale qualified values directories, e.g. values-fr, values-pt-rBR and values-b+sr+Latn. Other qualifiers such as
+# values-night or values-v21 are not translations and are not deconstructed.
+LOCALE_DIRECTORY_PATTERN = re.compile(r"^values-(?:[a-z]{2,3}(?:-r[A-Z]{2})?|b\+[A-Za-z0-9+]+)$")
+BATCH_IGNORED_DIRECTORIES = {"build", ".git", ".gradle", ".idea", "node_modules"}
+MERGE_COMMENT_AUTHOR = "Android Translation Strings Tool"
+MERGE_UPDATED_COMMENT = "Source string or modifiers updated from strings.xml, translations may need revisiting."
+MERGE_REMOVED_COMMENT = "No longer present in strings.xml."
+CACHE_INDEX_TITLE = "index.json"
+CACHE_ENTRY_EXTENSION = ".sheet"
+# Bump whenever SheetData or its encoding changes, so that existing cache entries are ignored.
+CACHE_VERSION = 3
+DEFAULT_CACHE_SIZE_MB = 256
+DEFAULT_WATCH_INTERVAL = 1.0
+DEFAULT_WATCH_DEBOUNCE = 2.0
+MANIFEST_TITLE = "strings_manifest.json"
+# Bump whenever the constructed strings.xml output changes, so that incremental runs rebuild every language.
+MANIFEST_VERSION = 3
+FORMAT_XLSX = "xlsx"
+FORMAT_CSV = "csv"
+FORMAT_TSV = "tsv"
+DELIMITED_DIALECTS = {FORMAT_CSV: "excel", FORMAT_TSV: "excel-tab"}
+ISSUE_DUPLICATE_KEY = "duplicate key"
+ISSUE_MISSING_TRANSLATION = "missing translation"
+ISSUE_PLACEHOLDER_MISMATCH = "placeholder mismatch"
+# Android/Java format specifiers such as %s, %d, %1$s and %.2f. "%%" is matched so that it can be ignored. Java's
+# space flag ("% d") is left out, as it would match ordinary text such as "100 % des" or "100% of".
+PLACEHOLDER_PATTERN = re.compile(r"%(?:\d+\$)?[-#+0,(<]*\d*(?:\.\d+)?(?:[tT])?[a-zA-Z%]")
+SHARD_BY_ROWS = "rows"
+SHARD_BY_PREFIX = "prefix"
+SHARD_INDEX_TITLE = "Shard Index"
+SHARD_INDEX_HEADINGS = ["Worksheet", "Workbook", "First Row", "Last Row", "Order"]
+SHARD_INDEX_COLUMN_WIDTHS = [28, 36, 12, 12, 60]
+# A prefix sharded index row's "Order" cell lists where its rows go in the merged worksheet as ranges of worksheet rows,
+# e.g. "2-41 96-130". Longer lists are continued on further index rows, keeping each cell within Excel's limit.
+SHARD_ORDER_RANGE_SEPARATOR = " "
+SHARD_ORDER_CELL_LIMIT = 32000
+# Shard workbooks are saved beside the index workbook as <name>.shard<number>.xlsx.
+SHARD_FILE_FORMAT = "{}.shard{}.xlsx"
+SHARD_FILE_PATTERN = re.compile(r"\.shard\d+\.xlsx$")
+KEY_PREFIX_SEPARATOR = "_"
+# Joins the keys of a deduplicated string's row, the canonical key first, see dedup_rows. Android resource names never
+# contain a comma.
+KEY_ALIAS_SEPARATOR = ","
+# Modifiers of a string or item whose content is more than a chain of modifiers around its text, e.g. text beside a
+# <b></b> element or a modifier with attributes. Its inner XML is kept in the string's cell, see
+# derive_modifiers_and_string.
+MARKUP_MODIFIER = "<markup>"
+MARKUP_MODIFIERS = (MARKUP_MODIFIER,)
+# Namespaces used within Android strings, e.g. <xliff:g id="name">%1$s</xliff:g>. Their elements are written to the
+# spreadsheet with these prefixes rather than ElementTree's {uri}tag names, and are declared again on construction.
+XML_NAMESPACES = {"xliff": "urn:oasis:names:tc:xliff:document:1.2",
+                  "tools": "http://schemas.android.com/tools",
+                  "android": "http://schemas.android.com/apk/res/android"}
+NAMESPACE_PREFIXES = {uri: prefix for prefix, uri in XML_NAMESPACES.items()}
+# Progress of long stages is logged at most this often, in seconds, checking the clock every PROGRESS_CHECK_ROWS rows.
+PROGRESS_INTERVAL = 5.0
+PROGRESS_CHECK_ROWS = 4096
+STYLE_NONE = "none"
+STYLE_FAST = "fast"
+STYLE_FULL = "full"
+
+# Sheet rows held by each construction worker process, see initialise_construction_worker.
+_worker_rows = None
+# Letters of every Excel column, built on first use by get_column_value.
+_column_letters = None
+# Interned modifier tuples, keyed by both their worksheet string and their tuple, see decode_modifiers.
+_modifier_cache = {}
 
 #
-# logger setup
+# logger setup, handlers are only added when run from the command line (see configure_logging)
 #
 logger = logging.getLogger("Android Translation Strings Tool")
-logger.setLevel(logging.DEBUG)
 
-handler = logging.StreamHandler()
-handler.setLevel(logging.DEBUG)
+#
+# metrics
+#
+stage_metrics = StageMetrics()
 
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
 
-logger.addHandler(handler)
+def configure_logging():
+    """ Configure Logging
 
-#
-# args
-#
-parser = argparse.ArgumentParser(prog="Android Translation Strings Tool",
-                                 formatter_class=argparse.RawDescriptionHelpFormatter,
-                                 description="This tool has been designed to simplify the file "
-                                             "deconstruction/construction required\nduring the process of extending an "
-                                             "Android project’s User Interface (UI) strings.xml\nfile to different "
-                                             "languages.\n\nThe tool interrogates the provided strings.xml file and "
-                                             "uses its contents to populated\na structured spreadsheet. The translated "
-                                             "UI strings can then can copied into this\nspreadsheet and the tool will "
-                                             "reverse the process and create the appropriate\nstrings.xml file for all "
-                                             "supplied languages.\n\nWARNING - This tool will automatically overwrite "
-                                             "files.")
-group = parser.add_mutually_exclusive_group()
-
-group.add_argument("-d", "--deconstruct", action="store_true", help="Deconstructs strings.xml into spreadsheet.")
-group.add_argument("-c", "--construct", action="store_true",
-                   help="Constructs all required strings.xml files from parsed Excel spreadsheet.")
-
-parser.add_argument("excel_file_name", type=str, help="Excel file name that will be created or is being read from.")
-parser.add_argument("source_path", type=str, help="Directory of data source (strings.xml file or spreadsheet).")
-parser.add_argument("destination_path", nargs='?', default=DESTINATION_STRING_NOT_DEFINED, type=str,
-                    help="Optional, if included, output file(s) will be stored in this directory.")
+    Logs every message to stderr, as the command line tool does. Not called when the tool is imported as a library, so
+    that the embedding application's own logging configuration is used.
+    """
+    logger.setLevel(logging.DEBUG)
+
+    handler = logging.StreamHandler()
+    handler.setLevel(logging.DEBUG)
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handler.setFormatter(formatter)
+
+    logger.addHandler(handler)
+
+
+def create_parser():
+    """ Create Parser
+
+    Builds the command line argument parser.
+
+    :return parser:     argparse.ArgumentParser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="Android Translation Strings Tool", formatter_class=argparse.RawDescriptionHelpFormatter,
+        description="This tool has been designed to simplify the file deconstruction/construction required\nduring the "
+                    "process of extending an Android project’s User Interface (UI) strings.xml\nfile to different "
+                    "languages.\n\nThe tool interrogates the provided strings.xml file and uses its contents to "
+                    "populated\na structured spreadsheet. The translated UI strings can then can copied into this\n"
+                    "spreadsheet and the tool will reverse the process and create the appropriate\nstrings.xml file "
+                    "for all supplied languages.\n\nWARNING - This tool will automatically overwrite files.")
+    group = parser.add_mutually_exclusive_group()
+
+    group.add_argument("-d", "--deconstruct", action="store_true", help="Deconstructs strings.xml into spreadsheet.")
+    group.add_argument("-c", "--construct", action="store_true",
+                       help="Constructs all required strings.xml files from parsed Excel spreadsheet.")
+    group.add_argument("--validate", action="store_true",
+                       help="Checks the spreadsheet for duplicate keys, missing translations and placeholders (e.g. "
+                            "%%1$s) that differ from the first language, reports every problem found and exits with "
+                            "1 if there are any. Nothing is written.")
+    parser.add_argument("-b", "--batch", action="store_true",
+                        help="Deconstruction: source_path is an Android project root and every module's "
+                             "res/values/strings.xml is deconstructed into its own workbook, named "
+                             "EXCEL_FILE_NAME_<module>.xlsx. Construction: every EXCEL_FILE_NAME_<module>.xlsx in "
+                             "source_path is constructed into its own <module> folder. --jobs sets the shared pool "
+                             "size.")
+    parser.add_argument("-f", "--format", choices=[FORMAT_XLSX, FORMAT_CSV, FORMAT_TSV], default=FORMAT_XLSX,
+                        help="File format of the spreadsheet. 'csv' and 'tsv' keep the same column layout as the xlsx "
+                             "spreadsheet but are streamed without openpyxl. Default is xlsx.")
+    parser.add_argument("--cache-dir", type=str, default=None, metavar="DIR",
+                        help="Construction only. Caches the parsed spreadsheet contents in DIR, so later runs against "
+                             "the same, unchanged spreadsheet skip reading the xlsx file.")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE_MB, metavar="MB",
+                        help="Maximum size of the cache directory in megabytes, least recently used entries are "
+                             "removed first. Default is {}.".format(DEFAULT_CACHE_SIZE_MB))
+    parser.add_argument("-i", "--incremental", action="store_true",
+                        help="Construction only. Only rewrites the strings.xml files of languages whose content has "
+                             "changed since the last run, as recorded in " + MANIFEST_TITLE + " next to the outputs.")
+    parser.add_argument("--watch", action="store_true",
+                        help="Construction only. Keeps running after the first construction and reconstructs the "
+                             "languages whose content has changed each time the spreadsheet is saved. Stop with "
+                             "Ctrl-C.")
+    parser.add_argument("--watch-strings", type=str, default=None, metavar="DIR",
+                        help="With --watch, also watches the strings.xml file in DIR and merges it into the "
+                             "spreadsheet whenever it changes, xlsx only.")
+    parser.add_argument("--watch-interval", type=float, default=DEFAULT_WATCH_INTERVAL, metavar="SECONDS",
+                        help="With --watch, how often the watched files are polled. Default is {}."
+                        .format(DEFAULT_WATCH_INTERVAL))
+    parser.add_argument("--debounce", type=float, default=DEFAULT_WATCH_DEBOUNCE, metavar="SECONDS",
+                        help="With --watch, how long a changed file must be left unchanged before it is processed, so "
+                             "that a save in progress is not read. Default is {}.".format(DEFAULT_WATCH_DEBOUNCE))
+    parser.add_argument("--metrics", choices=["json"], default=None,
+                        help="Prints a report of the wall time, rows processed, rows per second and peak memory of "
+                             "each stage to stdout once the run completes.")
+    parser.add_argument("--profile", type=str, default=None, metavar="FILE",
+                        help="Runs under cProfile and dumps the stats to FILE (readable with pstats).")
+    parser.add_argument("-s", "--style", choices=[STYLE_NONE, STYLE_FAST, STYLE_FULL], default=STYLE_FULL,
+                        help="Deconstruction only. Amount of styling applied to the spreadsheet: 'none' writes "
+                             "headings only, 'fast' applies colours with fixed column widths and 'full' (default) also "
+                             "applies borders and fits columns A-C to their contents.")
+    parser.add_argument("-m", "--merge", action="store_true",
+                        help="Deconstruction only. Merges strings.xml into the existing spreadsheet, keeping every "
+                             "translation. New keys are inserted, changed and removed keys are flagged with comments.")
+    parser.add_argument("-w", "--write-only", action="store_true",
+                        help="Deconstruction only. Streams rows straight into the spreadsheet as they are read, "
+                             "keeping memory flat for very large strings.xml files. Columns A-C are given fixed "
+                             "widths.")
+    parser.add_argument("--shards", type=int, default=0, metavar="N",
+                        help="Deconstruction only, xlsx. Splits the rows across N worksheets, listed on a '" +
+                             SHARD_INDEX_TITLE + "' sheet that construction uses to merge them back in order. "
+                             "string-arrays and plurals are never split.")
+    parser.add_argument("--shard-by", choices=[SHARD_BY_ROWS, SHARD_BY_PREFIX], default=SHARD_BY_ROWS,
+                        help="With --shards, 'rows' (default) gives each shard an equal run of rows and 'prefix' "
+                             "keeps keys sharing the same prefix (the part before the first '_') in the same shard.")
+    parser.add_argument("--shard-workbooks", action="store_true",
+                        help="With --shards, saves each shard as its own workbook, EXCEL_FILE_NAME.shard<N>.xlsx, "
+                             "beside an index workbook.")
+    parser.add_argument("-l", "--locales", action="store_true",
+                        help="Deconstruction only. Also reads the strings.xml file of every locale folder beside "
+                             "source_path (values-fr, values-de, ...) into its own language column, named after the "
+                             "folder. --jobs sets how many are parsed at once.")
+    parser.add_argument("--dedup", action="store_true",
+                        help="Deconstruction only. Strings with identical text and modifiers share a single row, "
+                             "keyed by every one of their keys (e.g. 'ok,dialog_ok'), so that each is only translated "
+                             "once. Construction writes the translation to every key.")
+
+    parser.add_argument("excel_file_name", type=str, help="Excel file name that will be created or is being read from.")
+    parser.add_argument("source_path", type=str, help="Directory of data source (strings.xml file or spreadsheet).")
+    parser.add_argument("destination_path", nargs='?', default=DESTINATION_STRING_NOT_DEFINED, type=str,
+                        help="Optional, if included, output file(s) will be stored in this directory.")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of worker processes used to construct languages, or to read --locales files or "
+                             "shards, in parallel (0 uses every CPU). Default is 1, languages are processed one after "
+                             "another.")
+
+    return parser
 
 
 def main(args):
@@ -85,24 +426,226 @@ def main(args):
 
     Main function of script.
 
+    :param args: Arguments passed by caller.
+    """
+    stage_metrics.enabled = args.metrics is not None
+    stage_metrics.started = time.perf_counter()
+    profiler = None
+    if args.profile is not None:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    try:
+        run(args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            logger.info("Profile stats successfully saved at: {}".format(args.profile))
+        if args.metrics == "json":
+            mode = "deconstruct" if args.deconstruct else "construct" if args.construct else \
+                "validate" if args.validate else None
+            print(json.dumps(stage_metrics.report(mode), indent=2))
+
+
+def run(args):
+    """ Run
+
+    Launches the mode selected by the arguments.
+
     :param args: Arguments passed by caller.
     """
     try:
         logger.info("Selected mode: " + str(sys.argv[1]))
+        if args.watch and (args.deconstruct or args.batch):
+            logger.warning("--watch only applies to constructing a single spreadsheet and has been ignored.")
+
+        if args.deconstruct and args.batch:
+            launch_batch_deconstruction(args.source_path, args.destination_path, args.excel_file_name, args.jobs,
+                                        args.write_only, args.style, args.merge, args.format, args.locales,
+                                        args.shards, args.shard_by, args.shard_workbooks, args.dedup)
 
-        if args.deconstruct:
-            launch_xml_deconstruction(args.source_path, args.destination_path, args.excel_file_name)
+        elif args.construct and args.batch:
+            launch_batch_construction(args.source_path, args.destination_path, args.excel_file_name, args.jobs,
+                                      args.incremental, args.cache_dir, args.cache_size, args.format)
+
+        elif args.construct and args.watch:
+            launch_watch_construction(args.source_path, args.destination_path, args.excel_file_name, args.jobs,
+                                      args.cache_dir, args.cache_size, args.format, args.watch_strings,
+                                      args.watch_interval, args.debounce)
+
+        elif args.deconstruct:
+            launch_xml_deconstruction(args.source_path, args.destination_path, args.excel_file_name,
+                                      args.write_only, args.style, args.merge, args.format, args.locales, args.jobs,
+                                      args.shards, args.shard_by, args.shard_workbooks, args.dedup)
 
         elif args.construct:
-            launch_xml_construction(args.source_path, args.destination_path, args.excel_file_name)
+            launch_xml_construction(args.source_path, args.destination_path, args.excel_file_name, args.jobs,
+                                    args.incremental, args.cache_dir, args.cache_size, args.format)
+
+        elif args.validate:
+            if launch_validation(args.source_path, args.excel_file_name, args.cache_dir, args.cache_size,
+                                 args.format).issues:
+                exit(1)
         else:
             logger.warning("Do not recognise mode argument")
 
+    except KeyboardInterrupt:
+        # Every output file is written to a temporary file first, see save_atomically.
+        logger.warning("Cancelled, files not yet completed have been discarded.")
+        exit(130)
+    except TranslationStringsError as exception:
+        logger.error(str(exception))
+        exit(1)
     except Exception as exception:
         logger.error(repr(exception) + '\n' + str(exception.args) + '\n' + traceback.format_exc())
 
 
-def launch_xml_deconstruction(source_path, destin_path, filename):
+def deconstruct(excel_file_name, source_path, destination_path=None, write_only=False, style=STYLE_FULL,
+                merge=False, file_format=FORMAT_XLSX, locales=False, jobs=1, shards=0, shard_by=SHARD_BY_ROWS,
+                shard_workbooks=False, dedup=False):
+    """ Deconstruct
+
+    Library entry point equivalent to the -d command line mode. Deconstructs source_path/strings.xml into a
+    spreadsheet, raising a TranslationStringsError subclass rather than exiting on failure.
+
+    :param excel_file_name:     Filename of the created spreadsheet.
+    :param source_path:         Directory of the strings.xml file.
+    :param destination_path:    Optional directory the spreadsheet is saved in, defaults to source_path.
+    :param write_only:          If true, rows are streamed into a write-only workbook as they are read.
+    :param style:               Amount of styling to apply, STYLE_NONE, STYLE_FAST or STYLE_FULL.
+    :param merge:               If true, strings.xml is merged into the existing spreadsheet rather than a new one.
+    :param file_format:         FORMAT_XLSX, FORMAT_CSV or FORMAT_TSV.
+    :param locales:             If true, every values-*/strings.xml beside source_path is read into its own column.
+    :param jobs:                Number of worker processes reading the locale files, 0 uses every CPU.
+    :param shards:              If more than 1, the rows are split across this many worksheets, see plan_shards.
+    :param shard_by:            SHARD_BY_ROWS or SHARD_BY_PREFIX.
+    :param shard_workbooks:     If true, each shard is saved as its own workbook.
+    :param dedup:               If true, strings with identical text and modifiers share a row, see dedup_rows.
+    :return:                    DeconstructionResult of the saved file's path and the number of element rows.
+    """
+    if destination_path is None:
+        destination_path = DESTINATION_STRING_NOT_DEFINED
+    return launch_xml_deconstruction(source_path, destination_path, excel_file_name, write_only, style, merge,
+                                     file_format, locales, jobs, shards, shard_by, shard_workbooks, dedup)
+
+
+def construct(excel_file_name, source_path, destination_path=None, jobs=1, incremental=False, cache_path=None,
+              cache_size=DEFAULT_CACHE_SIZE_MB, file_format=FORMAT_XLSX):
+    """ Construct
+
+    Library entry point equivalent to the -c command line mode. Constructs a strings.xml file for every language in
+    the spreadsheet, raising a TranslationStringsError subclass rather than exiting on failure.
+
+    :param excel_file_name:     Filename of the spreadsheet.
+    :param source_path:         Directory of the spreadsheet.
+    :param destination_path:    Optional directory the language folders are created in, defaults to source_path.
+    :param jobs:                Number of worker processes to construct languages with, 0 uses every CPU.
+    :param incremental:         If true, languages unchanged since the last run are not rewritten.
+    :param cache_path:          Optional directory of the parsed workbook cache, if None the cache is not used.
+    :param cache_size:          Maximum size of the parsed workbook cache in megabytes.
+    :param file_format:         FORMAT_XLSX, FORMAT_CSV or FORMAT_TSV.
+    :return:                    ConstructionResult of the languages, their directories and which were constructed
+                                or skipped as unchanged.
+    """
+    if destination_path is None:
+        destination_path = DESTINATION_STRING_NOT_DEFINED
+    return launch_xml_construction(source_path, destination_path, excel_file_name, jobs, incremental, cache_path,
+                                   cache_size, file_format)
+
+
+def validate(excel_file_name, source_path, cache_path=None, cache_size=DEFAULT_CACHE_SIZE_MB, file_format=FORMAT_XLSX):
+    """ Validate
+
+    Library entry point equivalent to the --validate command line mode.
+
+    :param excel_file_name:     Filename of the spreadsheet.
+    :param source_path:         Directory of the spreadsheet.
+    :param cache_path:          Optional directory of the parsed workbook cache, if None the cache is not used.
+    :param cache_size:          Maximum size of the parsed workbook cache in megabytes.
+    :param file_format:         FORMAT_XLSX, FORMAT_CSV or FORMAT_TSV.
+    :return:                    ValidationResult listing every ValidationIssue found.
+    """
+    return launch_validation(source_path, excel_file_name, cache_path, cache_size, file_format)
+
+
+def measure_stage(stage, count_rows=None):
+    """ Measure Stage
+
+    Decorator that records the wall time, rows processed and process peak memory of every call to the decorated
+    function in stage_metrics, while --metrics is enabled.
+
+    :param stage:       Name of the stage.
+    :param count_rows:  Optional function given the result and the call's arguments, returning the rows processed.
+    :return:            Decorator.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not stage_metrics.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            seconds = time.perf_counter() - start
+            stage_metrics.record(stage, seconds, count_rows(result, *args) if count_rows is not None else 0)
+            return result
+        return wrapper
+    return decorator
+
+
+def measure_generator_stage(stage):
+    """ Measure Generator Stage
+
+    Decorator for generators that records the time spent producing items, excluding the time the consumer spends
+    between items, along with the number of items produced.
+
+    :param stage:   Name of the stage.
+    :return:        Decorator.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not stage_metrics.enabled:
+                yield from function(*args, **kwargs)
+                return
+            generator = function(*args, **kwargs)
+            seconds = 0.0
+            items = 0
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        break
+                    finally:
+                        seconds += time.perf_counter() - start
+                    items += 1
+                    yield item
+            finally:
+                stage_metrics.record(stage, seconds, items)
+        return wrapper
+    return decorator
+
+
+def get_peak_memory_mb():
+    """ Get Peak Memory MB
+
+    :return:    Peak resident memory of this process so far in megabytes, or None where it cannot be measured.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+    if sys.platform == "darwin":
+        return round(peak / (1024 * 1024), 1)
+    return round(peak / 1024, 1)
+
+
+def launch_xml_deconstruction(source_path, destin_path, filename, write_only=False, style=STYLE_FULL, merge=False,
+                              file_format=FORMAT_XLSX, locales=False, jobs=1, shards=0, shard_by=SHARD_BY_ROWS,
+                              shard_workbooks=False, dedup=False):
     """ Launch strings.xml file deconstruction
 
     Called from main and initiates the deconstruction of the supplied strings.xml file.
@@ -110,9 +653,49 @@ def launch_xml_deconstruction(source_path, destin_path, filename):
     :param source_path:    User provided path of strings.xml file.
     :param destin_path:    Destination path of constructed spreadsheet.
     :param filename:       Filename of created Excel file.
+    :param write_only:     If true, rows are streamed into a write-only workbook as they are read.
+    :param style:          Amount of styling to apply, STYLE_NONE, STYLE_FAST or STYLE_FULL.
+    :param merge:          If true, strings.xml is merged into the existing spreadsheet rather than a new one.
+    :param file_format:    FORMAT_XLSX, or FORMAT_CSV/FORMAT_TSV to write a delimited file without openPyXl.
+    :param locales:        If true, every values-*/strings.xml beside source_path is read into its own column.
+    :param jobs:           Number of worker processes reading the locale files, 0 uses every CPU.
+    :param shards:         If more than 1, the rows are split across this many worksheets, see plan_shards.
+    :param shard_by:       SHARD_BY_ROWS or SHARD_BY_PREFIX.
+    :param shard_workbooks: If true, each shard is saved as its own workbook beside an index workbook.
+    :param dedup:          If true, strings with identical text and modifiers share a row, see dedup_rows.
+    :return:               DeconstructionResult of the saved file's path and the number of element rows.
     """
-    xml_items = read_xml_file(source_path)
-    workbook = openpyxl.Workbook()
+    locale_columns = None
+    if locales and merge:
+        logger.warning("--locales does not apply to --merge and has been ignored.")
+    elif locales:
+        locale_columns = read_locale_columns(source_path, jobs)
+    if dedup and merge:
+        logger.warning("--dedup does not apply to --merge and has been ignored.")
+
+    xml_items = iterate_xml_file(source_path)
+
+    if file_format != FORMAT_XLSX:
+        if merge or write_only or shards > 1:
+            logger.warning("--merge, --write-only and --shards only apply to xlsx spreadsheets and have been ignored.")
+        file_path = get_delimited_file_path(source_path, destin_path, filename, file_format)
+        rows = write_delimited_file(xml_items, file_path, file_format, locale_columns, dedup)
+        logger.info("{} file successfully saved at: {}".format(file_format.upper(), file_path))
+        return DeconstructionResult(file_path, rows)
+
+    if merge:
+        if shards > 1:
+            logger.warning("--shards does not apply to --merge and has been ignored.")
+        return launch_xml_merge(xml_items, source_path, destin_path, filename)
+
+    if shards > 1:
+        if write_only:
+            logger.warning("--write-only does not apply to sharded spreadsheets and has been ignored.")
+        return launch_sharded_deconstruction(xml_items, source_path, destin_path, filename, style, locale_columns,
+                                             shards, shard_by, shard_workbooks, dedup)
+
+    import openpyxl
+    workbook = openpyxl.Workbook(write_only=write_only)
 
     for i in workbook.worksheets:
         workbook.remove(i)
@@ -120,10 +703,255 @@ def launch_xml_deconstruction(source_path, destin_path, filename):
     workbook.create_sheet(WORKSHEET_TITLE)
     worksheet = workbook[WORKSHEET_TITLE]
 
-    populate_worksheet(xml_items, worksheet)
+    if write_only:
+        rows = stream_worksheet(xml_items, worksheet, style, locale_columns, dedup)
+    else:
+        column_lengths = populate_worksheet(xml_items, worksheet, locale_columns, dedup)
+        rows = worksheet.max_row - 1
+
+        style_worksheet(worksheet, style, get_headings(locale_columns), column_lengths)
+
+    file_path = get_excel_file_path(source_path, destin_path, filename)
+    save_workbook(workbook, file_path)
+    return DeconstructionResult(file_path, rows)
+
+
+def launch_xml_merge(xml_elements, source_path, destin_path, filename):
+    """ Launch strings.xml file merge
+
+    Merges the supplied strings.xml elements into the spreadsheet created by an earlier deconstruction, keeping any
+    translations already entered, and saves it back in place.
+
+    :param xml_elements:   The XML elements that have been taken from the parsed strings.xml.
+    :param source_path:    User provided path of strings.xml file.
+    :param destin_path:    Destination path of the spreadsheet.
+    :param filename:       Filename of the existing Excel file.
+    :return:               DeconstructionResult of the saved file's path and the number of element rows.
+    """
+    if destin_path == DESTINATION_STRING_NOT_DEFINED:
+        excel_path = source_path
+    else:
+        excel_path = destin_path
+
+    workbook = read_excel_file(excel_path, filename, read_only=False)
+    worksheet = get_excel_worksheet(workbook, WORKSHEET_TITLE)
+
+    merge_worksheet(xml_elements, worksheet)
+
+    file_path = get_excel_file_path(source_path, destin_path, filename)
+    save_workbook(workbook, file_path)
+    return DeconstructionResult(file_path, worksheet.max_row - 1)
+
+
+def launch_sharded_deconstruction(xml_elements, source_path, destin_path, filename, style=STYLE_FULL,
+                                  locale_columns=None, shards=2, shard_by=SHARD_BY_ROWS, shard_workbooks=False,
+                                  dedup=False):
+    """ Launch sharded strings.xml file deconstruction
+
+    Splits the rows across several worksheets, each laid out and styled like the single deconstructed worksheet, so
+    that no one sheet is too large to load or work in. A shard index sheet lists the runs of rows held by each shard
+    and where they go in the original element order, which construction uses to merge the shards back together (see
+    read_sharded_rows).
+
+    :param xml_elements:    The XML elements that have been taken from the parsed strings.xml.
+    :param source_path:     User provided path of strings.xml file.
+    :param destin_path:     Destination path of the spreadsheet.
+    :param filename:        Filename of the created Excel file.
+    :param style:           Amount of styling to apply, STYLE_NONE, STYLE_FAST or STYLE_FULL.
+    :param locale_columns:  Optional LocaleColumns written after the English column.
+    :param shards:          Number of shards to split the rows across.
+    :param shard_by:        SHARD_BY_ROWS or SHARD_BY_PREFIX, see plan_shards.
+    :param shard_workbooks: If true, each shard is saved as its own workbook beside the index workbook, otherwise
+                            every shard is a worksheet of the index workbook.
+    :param dedup:           If true, strings with identical text and modifiers share a row, see dedup_rows.
+    :return:                DeconstructionResult of the index workbook's path and the number of element rows.
+    """
+    import openpyxl
+    rows = list(derive_worksheet_rows(xml_elements, locale_columns, dedup))
+    shard_rows, runs = plan_shards(rows, shards, shard_by)
+    headings = get_headings(locale_columns)
+    file_path = get_excel_file_path(source_path, destin_path, filename)
+
+    workbook = openpyxl.Workbook()
+    index_worksheet = workbook.active
+    index_worksheet.title = SHARD_INDEX_TITLE
+
+    locations = []
+    for shard_number, rows_of_shard in enumerate(shard_rows, 1):
+        if shard_workbooks:
+            shard_filename = SHARD_FILE_FORMAT.format(strip_excel_extension(os.path.basename(file_path)),
+                                                      shard_number)
+            shard_workbook = openpyxl.Workbook()
+            worksheet = shard_workbook.active
+            worksheet.title = WORKSHEET_TITLE
+            locations.append((WORKSHEET_TITLE, shard_filename))
+        else:
+            worksheet = workbook.create_sheet("{} {}".format(WORKSHEET_TITLE, shard_number))
+            locations.append((worksheet.title, None))
+
+        column_lengths = populate_worksheet_rows(rows_of_shard, worksheet)
+        style_worksheet(worksheet, style, headings, column_lengths)
+        if shard_workbooks:
+            save_workbook(shard_workbook, os.path.join(os.path.dirname(file_path), shard_filename))
+
+    index_worksheet.append(SHARD_INDEX_HEADINGS)
+    for shard_index, first_row, last_row, order in runs:
+        index_worksheet.append(locations[shard_index] + (first_row, last_row, order))
+    for index, width in enumerate(SHARD_INDEX_COLUMN_WIDTHS):
+        index_worksheet.column_dimensions[get_column_value(index)].width = width
+    logger.info("{} rows split across {} shards in {} runs.".format(len(rows), len(shard_rows), len(runs)))
+
+    save_workbook(workbook, file_path)
+    return DeconstructionResult(file_path, len(rows))
+
+
+def plan_shards(rows, shards, shard_by=SHARD_BY_ROWS):
+    """ Plan Shards
+
+    Splits the worksheet rows into shards of roughly equal size, never separating a string-array or plurals from its
+    items. SHARD_BY_ROWS gives each shard one contiguous run of rows, listed in original row order. SHARD_BY_PREFIX
+    keeps every element whose key shares a prefix (the part before the first KEY_PREFIX_SEPARATOR) in the same shard,
+    prefixes being assigned to shards in the order they first appear. Rows keep their original order within each
+    shard, and shards left empty are dropped. As interleaved prefixes would need a run at every prefix change, a
+    prefix sharded shard is listed as a single run whose order gives the ranges of original rows it holds, see
+    format_shard_order.
+
+    :param rows:        List of worksheet row tuples, see derive_worksheet_rows.
+    :param shards:      Number of shards to split the rows across.
+    :param shard_by:    SHARD_BY_ROWS or SHARD_BY_PREFIX.
+    :return shard_rows: List of each shard's rows.
+    :return runs:       List of (shard index, first worksheet row, last worksheet row, order) tuples, order being None
+                        for SHARD_BY_ROWS.
+    """
+    # Each unit is an element and its items: (prefix, first row index, end row index).
+    units = []
+    for index, row in enumerate(rows):
+        if row[CellType.cell_type.value] != "item" or not units:
+            key = row[CellType.key.value]
+            units.append([str(key).split(KEY_PREFIX_SEPARATOR, 1)[0] if key is not None else "", index, index + 1])
+        else:
+            units[-1][2] = index + 1
+
+    target = -(-len(rows) // shards)
+    if shard_by == SHARD_BY_PREFIX:
+        prefix_sizes = {}
+        for prefix, start, end in units:
+            prefix_sizes[prefix] = prefix_sizes.get(prefix, 0) + end - start
+        groups = list(prefix_sizes.items())
+    else:
+        groups = [(unit_index, end - start) for unit_index, (_, start, end) in enumerate(units)]
+
+    group_shards = {}
+    shard = 0
+    count = 0
+    for group, size in groups:
+        if count >= target and shard < shards - 1:
+            shard += 1
+            count = 0
+        group_shards[group] = shard
+        count += size
+
+    shard_rows = [[] for _ in range(shards)]
+    # Ranges of original row indices held by each shard, in the order its rows are written.
+    shard_ranges = [[] for _ in range(shards)]
+    for unit_index, (prefix, start, end) in enumerate(units):
+        unit_shard = group_shards[prefix if shard_by == SHARD_BY_PREFIX else unit_index]
+        shard_rows[unit_shard].extend(rows[start:end])
+        if shard_ranges[unit_shard] and shard_ranges[unit_shard][-1][1] == start:
+            shard_ranges[unit_shard][-1][1] = end
+        else:
+            shard_ranges[unit_shard].append([start, end])
+
+    shard_ranges = [ranges for ranges, rows_of_shard in zip(shard_ranges, shard_rows) if rows_of_shard]
+    shard_rows = [rows_of_shard for rows_of_shard in shard_rows if rows_of_shard]
+    runs = []
+    for shard_index, (ranges, rows_of_shard) in enumerate(zip(shard_ranges, shard_rows)):
+        # Row shards are contiguous and in original order, so need no order of their own.
+        orders = format_shard_order(ranges) if shard_by == SHARD_BY_PREFIX else [(None, len(rows_of_shard))]
+        # Worksheet rows are one based and follow the heading row.
+        position = 2
+        for order, size in orders:
+            runs.append((shard_index, position, position + size - 1, order))
+            position += size
+    return shard_rows, runs
+
+
+def format_shard_order(ranges):
+    """ Format Shard Order
+
+    Formats the ranges of original rows held by a prefix sharded shard as the contents of index "Order" cells, each
+    range being written as worksheet rows, "first-last" or "row" for a single row. Ranges are split across as many
+    cells as are needed to keep each within SHARD_ORDER_CELL_LIMIT characters.
+
+    :param ranges:  List of [start, end) original row index ranges, in the order the shard holds them.
+    :return:        List of (order cell, number of rows it covers) tuples, one per index row.
+    """
+    cells = []
+    texts = []
+    length = 0
+    size = 0
+    for start, end in ranges:
+        # Worksheet rows are one based and follow the heading row.
+        text = str(start + 2) if end - start == 1 else "{}-{}".format(start + 2, end + 1)
+        if texts and length + len(text) + 1 > SHARD_ORDER_CELL_LIMIT:
+            cells.append((SHARD_ORDER_RANGE_SEPARATOR.join(texts), size))
+            texts = []
+            length = 0
+            size = 0
+        texts.append(text)
+        length += len(text) + 1
+        size += end - start
+    if texts:
+        cells.append((SHARD_ORDER_RANGE_SEPARATOR.join(texts), size))
+    return cells
+
+
+def parse_shard_order(order):
+    """ Parse Shard Order
+
+    Reverses format_shard_order for one index "Order" cell.
+
+    :param order:   Contents of the "Order" cell.
+    :return:        List of (first worksheet row, last worksheet row) tuples.
+    :raises ValueError: If the cell is not a list of row ranges.
+    """
+    ranges = []
+    for text in str(order).split():
+        first_row, _, last_row = text.partition("-")
+        ranges.append((int(first_row), int(last_row or first_row)))
+    return ranges
+
+
+def save_workbook(workbook, file_path):
+    """ Save Workbook
+
+    Saves the openPyXl workbook at the given path, through a temporary file (see save_atomically).
+
+    :param workbook:    openPyXl workbook.
+    :param file_path:   Full path of the Excel file.
+    """
+    try:
+        save_atomically(file_path, workbook.save)
+        logger.info("Excel file successfully saved at: {}".format(file_path))
+
+    except Exception as exception:
+        error_string_one = str(repr(exception))
+        error_string_two = str(exception.args)
+        error_string_three = str(traceback.format_exc())
+        logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
+        raise OutputFileError("There was an error while saving the Excel file at: {}".format(file_path))
+
+
+def get_excel_file_path(source_path, destin_path, filename):
+    """ Get Excel File Path
 
-    style_worksheet(worksheet)
+    Determines where the deconstructed spreadsheet is saved, adding the '.xlsx' extension when it is missing.
 
+    :param source_path:    User provided path of strings.xml file.
+    :param destin_path:    Destination path of constructed spreadsheet.
+    :param filename:       Filename of created Excel file.
+    :return file_path:     Full path of the Excel file.
+    """
     file_extension_included = False
 
     if '.xlsx' in filename:
@@ -140,40 +968,511 @@ def launch_xml_deconstruction(source_path, destin_path, filename):
         file_path = os.path.join(source_path, filename)
     else:
         file_path = os.path.join(destin_path, filename)
-    workbook.save(file_path)
-    logger.info("Excel file successfully saved at: {}".format(file_path))
+    return file_path
 
 
-def launch_xml_construction(source_path, destin_path, filename):
+def launch_xml_construction(source_path, destin_path, filename, jobs=1, incremental=False, cache_path=None,
+                            cache_size=DEFAULT_CACHE_SIZE_MB, file_format=FORMAT_XLSX):
     """ Launch strings.xml file construction
 
     Called from main and initiates the construction of the all required strings.xml files.
 
     :param source_path:    User provided path of Excel file.
     :param destin_path:    Destination path of constructed string.xml files.
-    :param common_path:    If true, output file directories should be stored in source_path.
     :param filename:       Filename of read Excel file.
+    :param jobs:           Number of worker processes to construct languages with, 0 uses every CPU.
+    :param incremental:    If true, languages whose content and output file are unchanged since the last run (as
+                           recorded in the manifest) are not rewritten.
+    :param cache_path:     Optional directory of the parsed workbook cache, if None the cache is not used.
+    :param cache_size:     Maximum size of the parsed workbook cache in megabytes.
+    :param file_format:    FORMAT_XLSX, or FORMAT_CSV/FORMAT_TSV to read a delimited file without openPyXl.
+    :return:               ConstructionResult of the languages, their directories and which were constructed or
+                           skipped as unchanged.
     """
-    workbook = read_excel_file(source_path, filename)
-    worksheet = get_excel_worksheet(workbook, WORKSHEET_TITLE)
+    sheet_data = load_sheet_data(source_path, filename, cache_path, cache_size, file_format, jobs)
+
+    directories = create_folders(sheet_data.languages, source_path, destin_path)
+    language_indices = list(range(len(directories)))
+
+    if incremental:
+        if destin_path == DESTINATION_STRING_NOT_DEFINED:
+            output_path = source_path
+        else:
+            output_path = destin_path
+        manifest = read_manifest(output_path)
+        content_hashes = [hash_language_content(sheet_data.rows, language_index) for language_index in language_indices]
+        language_indices = [language_index for language_index in language_indices
+                            if not is_language_current(manifest, sheet_data.languages[language_index],
+                                                       content_hashes[language_index], directories[language_index])]
+        logger.info("Incremental construction: {} languages unchanged (hits), {} languages to construct (misses).".
+                    format(len(directories) - len(language_indices), len(language_indices)))
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs > 1 and len(language_indices) > 1:
+        construct_languages_in_parallel(sheet_data, directories, language_indices, jobs)
+    else:
+        progress = ProgressReporter("create_xml_file", len(language_indices) * len(sheet_data.rows))
+        for done, language_index in enumerate(language_indices, 1):
+            create_xml_file(sheet_data, language_index, elementTree.Element('resources'), directories[language_index])
+            progress.update(done * len(sheet_data.rows))
+
+    if incremental:
+        update_manifest(manifest, sheet_data.languages, directories, content_hashes)
+        save_manifest(output_path, manifest)
 
-    number_of_rows = worksheet.max_row
-    number_of_columns = worksheet.max_column
+    constructed = [sheet_data.languages[language_index] for language_index in language_indices]
+    return ConstructionResult(list(sheet_data.languages), directories, constructed,
+                              [language for language in sheet_data.languages if language not in constructed])
+
+
+def load_sheet_data(source_path, filename, cache_path=None, cache_size=DEFAULT_CACHE_SIZE_MB, file_format=FORMAT_XLSX,
+                    jobs=1):
+    """ Load Sheet Data
+
+    Reads the spreadsheet's rows from the xlsx file, the parsed workbook cache or a CSV/TSV file.
+
+    :param source_path:    User provided path of Excel file.
+    :param filename:       Filename of read Excel file.
+    :param cache_path:     Optional directory of the parsed workbook cache, if None the cache is not used.
+    :param cache_size:     Maximum size of the parsed workbook cache in megabytes.
+    :param file_format:    FORMAT_XLSX, or FORMAT_CSV/FORMAT_TSV to read a delimited file without openPyXl.
+    :param jobs:           Number of worker processes reading the shards of a sharded workbook, 0 uses every CPU.
+    :return:               SheetData.
+    """
+    if file_format != FORMAT_XLSX:
+        sheet_data = read_delimited_file(source_path, filename, file_format)
+    elif cache_path is not None:
+        sheet_data = read_cached_sheet_data(source_path, filename, cache_path, cache_size, jobs)
+    else:
+        sheet_data = read_sheet_data(source_path, filename, jobs)
 
     logger.info("Excel file loaded. {} XML elements identified in {} languages.".
-                format(number_of_rows-1, number_of_columns-3))
+                format(len(sheet_data.rows), len(sheet_data.languages)))
+    return sheet_data
 
-    column_limit = create_folders(worksheet, number_of_columns, source_path, destin_path)
 
-    for column in range(3, column_limit+1):
-        if destin_path == DESTINATION_STRING_NOT_DEFINED:
-            directory = r"{}".format(os.path.join(source_path,
-                                                  worksheet["{}1".format(get_column_value(column))].value))
+def launch_validation(source_path, filename, cache_path=None, cache_size=DEFAULT_CACHE_SIZE_MB,
+                      file_format=FORMAT_XLSX):
+    """ Launch Validation
+
+    Validates the spreadsheet and logs every problem found, followed by a summary of each kind of problem.
+
+    :param source_path:    User provided path of Excel file.
+    :param filename:       Filename of read Excel file.
+    :param cache_path:     Optional directory of the parsed workbook cache, if None the cache is not used.
+    :param cache_size:     Maximum size of the parsed workbook cache in megabytes.
+    :param file_format:    FORMAT_XLSX, FORMAT_CSV or FORMAT_TSV.
+    :return:               ValidationResult listing every ValidationIssue found.
+    """
+    sheet_data = load_sheet_data(source_path, filename, cache_path, cache_size, file_format)
+    issues = validate_sheet_data(sheet_data)
+
+    for issue in issues:
+        language = " ({})".format(issue.language) if issue.language is not None else ""
+        logger.warning("Row {}, {}{}: {}, {}".format(get_row_location(issue.sheet, issue.row), issue.key, language,
+                                                     issue.kind, issue.detail))
+
+    if issues:
+        counts = {}
+        for issue in issues:
+            counts[issue.kind] = counts.get(issue.kind, 0) + 1
+        logger.error("Validation found {} problems: {}.".format(
+            len(issues), ", ".join("{} {}".format(count, kind) for kind, count in counts.items())))
+    else:
+        logger.info("Validation passed, no problems found in {} rows.".format(len(sheet_data.rows)))
+
+    return ValidationResult(list(sheet_data.languages), len(sheet_data.rows), issues)
+
+
+def launch_watch_construction(source_path, destin_path, filename, jobs=1, cache_path=None,
+                              cache_size=DEFAULT_CACHE_SIZE_MB, file_format=FORMAT_XLSX, strings_path=None,
+                              interval=DEFAULT_WATCH_INTERVAL, debounce=DEFAULT_WATCH_DEBOUNCE):
+    """ Launch Watch Construction
+
+    Constructs the strings.xml files once, then keeps the process running and polls the spreadsheet (and optionally
+    the source strings.xml file) for changes. A changed file is only processed once it has been left unchanged for the
+    debounce period. A changed spreadsheet is reconstructed incrementally, so only the languages whose content
+    changed are rewritten, and a changed strings.xml file is merged into the spreadsheet, which in turn triggers a
+    reconstruction. Errors are logged and watching continues until interrupted with Ctrl-C.
+
+    :param source_path:    User provided path of Excel file.
+    :param destin_path:    Destination path of constructed string.xml files.
+    :param filename:       Filename of read Excel file.
+    :param jobs:           Number of worker processes to construct languages with, 0 uses every CPU.
+    :param cache_path:     Optional directory of the parsed workbook cache, if None the cache is not used.
+    :param cache_size:     Maximum size of the parsed workbook cache in megabytes.
+    :param file_format:    FORMAT_XLSX, FORMAT_CSV or FORMAT_TSV.
+    :param strings_path:   Optional directory of the source strings.xml file to watch and merge.
+    :param interval:       Seconds between each poll of the watched files.
+    :param debounce:       Seconds a changed file must be left unchanged before it is processed.
+    """
+    if file_format == FORMAT_XLSX:
+        sheet_path = get_excel_file_path(source_path, DESTINATION_STRING_NOT_DEFINED, filename)
+        sheet_paths = [sheet_path] + get_shard_file_paths(sheet_path)
+    else:
+        sheet_path = get_delimited_file_path(source_path, DESTINATION_STRING_NOT_DEFINED, filename, file_format)
+        sheet_paths = [sheet_path]
+
+    watched_paths = list(sheet_paths)
+    if strings_path is not None:
+        if file_format == FORMAT_XLSX:
+            watched_paths.append(os.path.join(strings_path, XML_TITLE))
         else:
-            directory = r"{}".format(os.path.join(destin_path,
-                                                  worksheet["{}1".format(get_column_value(column))].value))
+            logger.warning("--watch-strings merges into xlsx spreadsheets only and has been ignored.")
 
-        create_xml_file(worksheet, column, number_of_rows, elementTree.Element('resources'), directory)
+    def rebuild(path):
+        try:
+            if path in sheet_paths:
+                launch_xml_construction(source_path, destin_path, filename, jobs, True, cache_path, cache_size,
+                                        file_format)
+            else:
+                launch_xml_deconstruction(strings_path, source_path, filename, merge=True)
+        except TranslationStringsError as exception:
+            logger.error(str(exception))
+            logger.error("Processing " + os.path.basename(path) + " failed, waiting for the next change.")
+        except Exception as exception:
+            logger.debug(repr(exception) + "\n" + traceback.format_exc())
+            logger.error("Processing " + os.path.basename(path) + " failed, waiting for the next change.")
+
+    signatures = {path: get_file_signature(path) for path in watched_paths}
+    rebuild(sheet_path)
+    logger.info("Watching {} for changes, press Ctrl-C to stop.".format(", ".join(watched_paths)))
+
+    changed_at = {}
+    try:
+        while True:
+            time.sleep(interval)
+            now = time.monotonic()
+            for path in watched_paths:
+                signature = get_file_signature(path)
+                if signature != signatures[path]:
+                    signatures[path] = signature
+                    changed_at[path] = now
+
+            for path in [path for path in watched_paths if path in changed_at]:
+                if now - changed_at[path] >= debounce and signatures[path] is not None:
+                    del changed_at[path]
+                    logger.info("Change detected in {}.".format(os.path.basename(path)))
+                    rebuild(path)
+                    if path not in sheet_paths:
+                        # The merge rewrote the spreadsheet, its change is picked up and debounced by the next poll.
+                        signatures[path] = get_file_signature(path)
+    except KeyboardInterrupt:
+        logger.info("Watch stopped.")
+
+
+def get_file_signature(file_path):
+    """ Get File Signature
+
+    Returns a cheap signature of a file, which changes whenever the file is saved.
+
+    :param file_path:   Path of the file.
+    :return:            Tuple of the file's modification time and size, or None if it does not currently exist.
+    """
+    try:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def construct_languages_in_parallel(sheet_data, directories, language_indices, jobs):
+    """ Construct Languages in Parallel
+
+    Fans the languages out across a pool of worker processes, each of which builds and saves its own strings.xml
+    file. The sheet rows are handed to each worker once when it starts rather than with every language. Results are
+    collected in language order so that any failures are reported deterministically, after every language has been
+    attempted.
+
+    :param sheet_data:          SheetData read from the worksheet.
+    :param directories:         The output directory of each language, in the same order as sheet_data.languages.
+    :param language_indices:    Indices of the languages to construct.
+    :param jobs:                Maximum number of worker processes.
+    """
+    failed_languages = []
+    workers = min(jobs, len(language_indices))
+    logger.info("Constructing {} languages across {} worker processes.".format(len(language_indices), workers))
+
+    progress = ProgressReporter("create_xml_file", len(language_indices) * len(sheet_data.rows))
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialise_construction_worker,
+                             initargs=(sheet_data.rows, stage_metrics.enabled)) as executor:
+        futures = [executor.submit(construct_language, language_index, directories[language_index])
+                   for language_index in language_indices]
+
+        try:
+            for done, (language_index, future) in enumerate(zip(language_indices, futures), 1):
+                language = sheet_data.languages[language_index]
+                try:
+                    _, worker_metrics = future.result()
+                    stage_metrics.merge(worker_metrics)
+                except Exception as exception:
+                    logger.error("Construction of {} {} failed: {}".format(language, XML_TITLE, repr(exception)))
+                    failed_languages.append(language)
+                progress.update(done * len(sheet_data.rows))
+        except KeyboardInterrupt:
+            # Languages not yet started are dropped rather than left for the pool to finish.
+            for future in futures:
+                future.cancel()
+            raise
+
+    if failed_languages:
+        raise ConstructionError("{} of {} languages could not be constructed: {}".
+                                format(len(failed_languages), len(language_indices), ", ".join(failed_languages)),
+                                failed_languages)
+
+
+def initialise_construction_worker(rows, metrics_enabled=False):
+    """ Initialise Construction Worker
+
+    Runs once in each worker process and keeps the sheet rows for every language the worker goes on to construct.
+
+    :param rows:            SheetRow list read from the worksheet.
+    :param metrics_enabled: If true, the worker records stage metrics and hands them back with each result.
+    """
+    global _worker_rows
+    _worker_rows = rows
+    initialise_metrics_worker(metrics_enabled)
+
+
+def initialise_metrics_worker(metrics_enabled=False):
+    """ Initialise Metrics Worker
+
+    Runs once in each worker process, so that the stages it records can be handed back to the parent (see
+    run_measured).
+
+    :param metrics_enabled: If true, the worker records stage metrics.
+    """
+    stage_metrics.enabled = metrics_enabled
+    # Forked workers inherit the parent's stages so far, which the parent already holds.
+    stage_metrics.take()
+
+
+def run_measured(function, *arguments):
+    """ Run Measured
+
+    Worker process task that calls the function and hands back the stage metrics recorded while it ran, which the
+    parent merges into its own.
+
+    :param function:    Module level function to call.
+    :param arguments:   Arguments passed to the function.
+    :return result:     The function's return value.
+    :return metrics:    Stage metrics recorded during the call.
+    """
+    return function(*arguments), stage_metrics.take()
+
+
+def construct_language(language_index, directory):
+    """ Construct Language
+
+    Worker process task that builds and saves the strings.xml file for a single language.
+
+    :param language_index:  Index of the language within each row's values.
+    :param directory:       The path where the output file is to be saved.
+    :return directory:      Same path, once the file has been saved.
+    :return metrics:        Stage metrics recorded while constructing the language.
+    """
+    create_xml_file(SheetData([], _worker_rows), language_index, elementTree.Element('resources'), directory)
+    return directory, stage_metrics.take()
+
+
+def launch_batch_deconstruction(root_path, destin_path, filename, jobs=1, write_only=False, style=STYLE_FULL,
+                                merge=False, file_format=FORMAT_XLSX, locales=False, shards=0, shard_by=SHARD_BY_ROWS,
+                                shard_workbooks=False, dedup=False):
+    """ Launch batch strings.xml file deconstruction
+
+    Discovers every module's res/values/strings.xml file under the project root and deconstructs each one into its own
+    workbook, all within this process or a single shared pool of worker processes.
+
+    :param root_path:      User provided root directory of the Android project.
+    :param destin_path:    Destination path of the constructed spreadsheets.
+    :param filename:       Filename prefix of the created Excel files.
+    :param jobs:           Number of worker processes, 0 uses every CPU.
+    :param write_only:     If true, rows are streamed into write-only workbooks as they are read.
+    :param style:          Amount of styling to apply, STYLE_NONE, STYLE_FAST or STYLE_FULL.
+    :param merge:          If true, each strings.xml is merged into the module's existing spreadsheet.
+    :param file_format:    FORMAT_XLSX, FORMAT_CSV or FORMAT_TSV.
+    :param locales:        If true, each module's values-*/strings.xml files are read into their own columns.
+    :param shards:         If more than 1, each module's rows are split across this many worksheets.
+    :param shard_by:       SHARD_BY_ROWS or SHARD_BY_PREFIX.
+    :param shard_workbooks: If true, each shard is saved as its own workbook.
+    :param dedup:          If true, strings with identical text and modifiers share a row, see dedup_rows.
+    :return:               Dictionary of each module's result, keyed by module name.
+    """
+    if not os.path.isdir(root_path):
+        raise SourceNotFoundError("Was unable to find the project directory: " + root_path)
+
+    modules = discover_string_files(root_path)
+    if destin_path == DESTINATION_STRING_NOT_DEFINED:
+        destin_path = root_path
+    prefix = strip_excel_extension(filename)
+
+    tasks = []
+    for module in modules:
+        if BASE_VALUES_DIRECTORY not in module.values_directories:
+            logger.warning("Module {} has no {}/{}, it has been skipped.".
+                           format(module.name, BASE_VALUES_DIRECTORY, XML_TITLE))
+            continue
+        tasks.append((module.name, launch_xml_deconstruction,
+                      (os.path.join(module.res_path, BASE_VALUES_DIRECTORY), destin_path,
+                       "{}_{}".format(prefix, module.name), write_only, style, merge, file_format, locales, 1, shards,
+                       shard_by, shard_workbooks, dedup)))
+
+    logger.info("{} modules found under: {}, {} will be deconstructed.".format(len(modules), root_path, len(tasks)))
+    return run_batch(tasks, jobs)
+
+
+def launch_batch_construction(source_path, destin_path, filename, jobs=1, incremental=False, cache_path=None,
+                              cache_size=DEFAULT_CACHE_SIZE_MB, file_format=FORMAT_XLSX):
+    """ Launch batch strings.xml file construction
+
+    Constructs the strings.xml files of every module workbook created by a batch deconstruction, each into its own
+    module folder, all within this process or a single shared pool of worker processes.
+
+    :param source_path:    User provided path of the Excel files.
+    :param destin_path:    Destination path of the module folders.
+    :param filename:       Filename prefix of the Excel files.
+    :param jobs:           Number of worker processes, 0 uses every CPU.
+    :param incremental:    If true, unchanged languages are not rewritten (see launch_xml_construction).
+    :param cache_path:     Optional directory of the parsed workbook cache, if None the cache is not used.
+    :param cache_size:     Maximum size of the parsed workbook cache in megabytes.
+    :param file_format:    FORMAT_XLSX, FORMAT_CSV or FORMAT_TSV.
+    :return:               Dictionary of each module's result, keyed by module name.
+    """
+    if destin_path == DESTINATION_STRING_NOT_DEFINED:
+        destin_path = source_path
+    prefix = "{}_".format(strip_excel_extension(filename))
+    extension = ".{}".format(file_format)
+
+    if not os.path.isdir(source_path):
+        raise SourceNotFoundError("Was unable to find the spreadsheet directory: " + source_path)
+
+    tasks = []
+    for excel_file in sorted(os.listdir(source_path)):
+        if excel_file.startswith(prefix) and excel_file.endswith(extension) and \
+                not SHARD_FILE_PATTERN.search(excel_file):
+            module_name = excel_file[len(prefix):-len(extension)]
+            tasks.append((module_name, launch_xml_construction,
+                          (source_path, os.path.join(destin_path, module_name), excel_file, 1, incremental,
+                           cache_path, cache_size, file_format)))
+
+    logger.info("{} module spreadsheets found in: {}.".format(len(tasks), source_path))
+    return run_batch(tasks, jobs)
+
+
+def run_batch(tasks, jobs):
+    """ Run Batch
+
+    Runs each batch task, either one after another in this process or across a shared pool of worker processes.
+    Results are collected in task order so that any failures are reported deterministically, after every task has
+    been attempted.
+
+    :param tasks:   List of (name, function, arguments) tuples.
+    :param jobs:    Number of worker processes, 0 uses every CPU.
+    :return:        Dictionary of each task's result, keyed by its name.
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    results = {}
+    failed_tasks = []
+    if jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=initialise_metrics_worker,
+                                 initargs=(stage_metrics.enabled,)) as executor:
+            futures = [executor.submit(run_measured, function, *arguments) for _, function, arguments in tasks]
+            try:
+                for (name, _, _), future in zip(tasks, futures):
+                    try:
+                        results[name], worker_metrics = future.result()
+                        stage_metrics.merge(worker_metrics)
+                    except Exception as exception:
+                        logger.error("Batch task for module {} failed: {}".format(name, repr(exception)))
+                        failed_tasks.append(name)
+            except KeyboardInterrupt:
+                for future in futures:
+                    future.cancel()
+                raise
+    else:
+        for name, function, arguments in tasks:
+            try:
+                results[name] = function(*arguments)
+            except Exception as exception:
+                logger.error("Batch task for module {} failed: {}".format(name, repr(exception)))
+                failed_tasks.append(name)
+
+    if failed_tasks:
+        raise ConstructionError("{} of {} modules failed: {}".
+                                format(len(failed_tasks), len(tasks), ", ".join(failed_tasks)), failed_tasks)
+    logger.info("Batch complete, {} modules processed.".format(len(tasks)))
+    return results
+
+
+def discover_string_files(root_path):
+    """ Discover String Files
+
+    Walks the project tree and finds every res directory containing values*/strings.xml files. Build output and
+    version control directories are not searched.
+
+    :param root_path:   Root directory of the Android project.
+    :return modules:    List of BatchModule, sorted by module name.
+    """
+    modules = []
+    names = set()
+    for directory, sub_directories, files in os.walk(root_path):
+        sub_directories[:] = sorted(sub_directory for sub_directory in sub_directories
+                                    if sub_directory not in BATCH_IGNORED_DIRECTORIES)
+        if os.path.basename(directory) != "res":
+            continue
+        values_directories = [sub_directory for sub_directory in sub_directories
+                              if sub_directory.startswith(BASE_VALUES_DIRECTORY) and
+                              os.path.isfile(os.path.join(directory, sub_directory, XML_TITLE))]
+        if values_directories:
+            name = get_module_name(root_path, directory)
+            unique_name = name
+            count = 1
+            while unique_name in names:
+                count += 1
+                unique_name = "{}_{}".format(name, count)
+            names.add(unique_name)
+            modules.append(BatchModule(unique_name, directory, values_directories))
+    return sorted(modules, key=lambda module: module.name)
+
+
+def get_module_name(root_path, res_path):
+    """ Get Module Name
+
+    Derives a module name from the location of a res directory, e.g. "app/src/main/res" gives "app" and
+    "feature/login/src/debug/res" gives "feature_login_debug".
+
+    :param root_path:   Root directory of the Android project.
+    :param res_path:    Path of the res directory.
+    :return:            Module name, safe to use within a filename.
+    """
+    parts = os.path.relpath(res_path, root_path).split(os.sep)[:-1]
+    source_set = None
+    if len(parts) >= 2 and parts[-2] == "src":
+        source_set = parts[-1]
+        parts = parts[:-2]
+    if not parts or parts == ["."]:
+        parts = [os.path.basename(os.path.abspath(root_path))]
+    if source_set is not None and source_set != "main":
+        parts.append(source_set)
+    return "_".join(parts)
+
+
+def strip_excel_extension(filename):
+    """ Strip Excel Extension
+
+    :param filename:    Excel filename, with or without its extension.
+    :return:            Filename without a '.xlsx' or '.xls' extension.
+    """
+    for extension in (".xlsx", ".xls"):
+        if filename.endswith(extension):
+            return filename[:-len(extension)]
+    return filename
 
 
 def read_xml_file(path):
@@ -184,39 +1483,136 @@ def read_xml_file(path):
     :param path:        User provided path of strings.xml file.
     :return children:   A list of all xml elements.
     """
+    return list(iterate_xml_file(path))
+
+
+@measure_generator_stage("read_xml_file")
+def iterate_xml_file(path):
+    """ Iterate XML File
+
+    Generator that streams the strings.xml file at the provided path with iterparse, yielding each top-level element
+    (string, string-array, plurals) as soon as its closing tag has been read. Yielded elements are detached from the
+    root once the caller moves on, so memory stays bounded by the largest single element rather than the whole file.
+
+    :param path:        User provided path of strings.xml file.
+    :return:            Generator of top-level xml elements.
+    """
     try:
         file_path = os.path.join(path, XML_TITLE)
-        xml_content = elementTree.parse(file_path)
-        xml_root = xml_content.getroot()
-        children = list(xml_root)
-
-        logger.info(XML_TITLE + " file successfully loaded, " + str(len(children)) + " items identified.")
+        number_of_children = 0
+        depth = 0
+        xml_root = None
+
+        for event, element in elementTree.iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                if xml_root is None:
+                    xml_root = element
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 1:
+                    number_of_children += 1
+                    yield element
+                    xml_root.clear()
 
-        return children
+        logger.info(XML_TITLE + " file successfully loaded, " + str(number_of_children) + " items identified.")
 
     except FileNotFoundError:
-        logger.error("Was unable to find " + XML_TITLE + " in provided path: " + path)
-        exit(1)
+        raise SourceNotFoundError("Was unable to find " + XML_TITLE + " in provided path: " + path)
     except elementTree.ParseError:
-        logger.error("Was unable to read " + XML_TITLE +
-                     " file, check that file is not empty and is correctly formatted")
-        exit(1)
+        raise SourceFileError("Was unable to read " + XML_TITLE +
+                              " file, check that file is not empty and is correctly formatted")
     except Exception as exception:
         error_string_one = str(repr(exception))
         error_string_two = str(exception.args)
         error_string_three = str(traceback.format_exc())
         logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
-        logger.error("There was an error during processing the parsed " + XML_TITLE + " file.")
-        exit(1)
+        raise SourceFileError("There was an error during processing the parsed " + XML_TITLE + " file.")
+
+
+def read_locale_columns(source_path, jobs=1):
+    """ Read Locale Columns
+
+    Reads the strings.xml file of every locale folder beside source_path into an index, either one after another or
+    across a pool of worker processes. Each index is built in a single pass of its file, so the base file can later be
+    joined to every locale in one pass of its own (see join_locale_rows).
 
+    :param source_path:     User provided path of the base strings.xml file.
+    :param jobs:            Number of worker processes, 0 uses every CPU.
+    :return:                LocaleColumns of the folder names and their indices, or None if there are no locales.
+    """
+    directories = discover_locale_directories(source_path)
+    if not directories:
+        logger.warning("No locale folders (values-*) containing {} found beside: {}, only the base file will be "
+                       "deconstructed.".format(XML_TITLE, source_path))
+        return None
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    paths = [path for _, path in directories]
+    if jobs > 1 and len(paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths)), initializer=initialise_metrics_worker,
+                                 initargs=(stage_metrics.enabled,)) as executor:
+            indices = []
+            for index, worker_metrics in executor.map(run_measured, [index_locale_file] * len(paths), paths):
+                indices.append(index)
+                stage_metrics.merge(worker_metrics)
+    else:
+        indices = [index_locale_file(path) for path in paths]
+
+    languages = [name for name, _ in directories]
+    logger.info("{} locales read: {}.".format(len(languages), ", ".join(languages)))
+    return LocaleColumns(languages, indices)
+
+
+def discover_locale_directories(source_path):
+    """ Discover Locale Directories
+
+    Finds the locale qualified values folders (see LOCALE_DIRECTORY_PATTERN) beside source_path that contain a
+    strings.xml file.
 
-def read_excel_file(path, filename):
+    :param source_path:     User provided path of the base strings.xml file.
+    :return:                List of (folder name, path) tuples, sorted by folder name.
+    """
+    parent_path = os.path.dirname(os.path.abspath(source_path))
+    base_name = os.path.basename(os.path.abspath(source_path))
+    directories = []
+    for name in sorted(os.listdir(parent_path)):
+        path = os.path.join(parent_path, name)
+        if name == base_name or not os.path.isfile(os.path.join(path, XML_TITLE)):
+            continue
+        if LOCALE_DIRECTORY_PATTERN.match(name):
+            directories.append((name, path))
+        elif name.startswith(BASE_VALUES_DIRECTORY + "-"):
+            logger.info("{} is not a locale folder, it has been skipped.".format(name))
+    return directories
+
+
+def index_locale_file(path):
+    """ Index Locale File
+
+    Reads a locale's strings.xml file into a dictionary of each row's modifiers and text, keyed by the row's identity.
+
+    :param path:    Path of the locale folder.
+    :return:        Dictionary of row identity to (modifiers, text).
+    """
+    return {identity: (row.modifiers, row.values[0])
+            for identity, row in identify_rows(decode_xml_elements(iterate_xml_file(path)))}
+
+
+@measure_stage("read_excel_file")
+def read_excel_file(path, filename, read_only=True):
     """ Read Excel File
 
-    Loads the Excel file into a openPyXl workbook.
+    Loads the Excel file into a openPyXl workbook. By default the workbook is opened in read-only mode, which streams
+    the worksheet XML rather than building every cell up front; read-only workbooks should be closed once read.
 
     :param path:        User provided path of Excel file.
     :param filename:    Filename of Excel file.
+    :param read_only:   If true, workbook is opened in openPyXl's read-only (streaming) mode.
+    :return workbook:   openPyXl workbook.
     """
     try:
         no_file_extension = False
@@ -224,31 +1620,380 @@ def read_excel_file(path, filename):
         if '.xlsx' in filename:
             no_file_extension = True
         elif '.xls' in filename:
-            logger.error("This tool is unable to process \'.xls\' files. Please ensure that Excel file has \'.xlsx\' "
-                         "extension.")
-            exit(1)
+            raise SourceFileError("This tool is unable to process \'.xls\' files. Please ensure that Excel file has "
+                                  "\'.xlsx\' extension.")
 
         if not no_file_extension:
             filename = "{}.xlsx".format(filename)
 
         if filename in path:
-            logger.error("Excel file read failed. Ensure that supplied path does not contain filename.")
-            exit(1)
+            raise SourceFileError("Excel file read failed. Ensure that supplied path does not contain filename.")
         else:
-            workbook = openpyxl.load_workbook(os.path.join(path, filename))
+            import openpyxl
+            workbook = openpyxl.load_workbook(os.path.join(path, filename), read_only=read_only)
             return workbook
 
     except FileNotFoundError:
-        logger.error("Was unable to find " + filename + " in provided path: " + path)
-        exit(1)
+        raise SourceNotFoundError("Was unable to find " + filename + " in provided path: " + path)
 
     except Exception as exception:
         error_string_one = str(repr(exception))
         error_string_two = str(exception.args)
         error_string_three = str(traceback.format_exc())
         logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
-        logger.error("There was an error during processing the parsed " + filename + " file.")
-        exit(1)
+        raise SourceFileError("There was an error during processing the parsed " + filename + " file.")
+
+
+def read_sheet_data(path, filename, jobs=1):
+    """ Read Sheet Data
+
+    Loads the Excel file and reads the strings worksheet into SheetData. Workbooks created with --shards are read
+    shard by shard and merged back together, see read_sharded_rows.
+
+    :param path:        User provided path of Excel file.
+    :param filename:    Filename of Excel file.
+    :param jobs:        Number of worker processes reading the shards of a sharded workbook, 0 uses every CPU.
+    :return:            SheetData read from the worksheet.
+    """
+    workbook = read_excel_file(path, filename)
+    if SHARD_INDEX_TITLE in workbook.sheetnames:
+        try:
+            return read_sharded_rows(path, filename, workbook, jobs)
+        finally:
+            workbook.close()
+    try:
+        return read_worksheet_rows(get_excel_worksheet(workbook, WORKSHEET_TITLE))
+    finally:
+        workbook.close()
+
+
+def read_sharded_rows(path, filename, workbook, jobs=1):
+    """ Read Sharded Rows
+
+    Reads every shard listed on the shard index sheet, either one after another or across a pool of worker processes,
+    and merges their rows back into the original element order. Runs with an order (prefix sharding) place their rows
+    at the original rows the order lists, other runs are taken in turn as the index lists them. Every shard must have
+    the same language headings and exactly the rows the index lists for it.
+
+    :param path:        User provided path of Excel file.
+    :param filename:    Filename of the index workbook.
+    :param workbook:    The index workbook, opened read-only.
+    :param jobs:        Number of worker processes, 0 uses every CPU.
+    :return:            SheetData of every shard's rows in original order.
+    """
+    runs = []
+    for row in get_excel_worksheet(workbook, SHARD_INDEX_TITLE).iter_rows(min_row=2, values_only=True):
+        # Indexes written before the "Order" column was added have one column fewer.
+        if len(row) < len(SHARD_INDEX_HEADINGS) - 1 or row[0] is None:
+            continue
+        order = row[4] if len(row) > 4 else None
+        try:
+            runs.append(((row[0], row[1]), int(row[2]), int(row[3]),
+                         parse_shard_order(order) if order is not None else None))
+        except (TypeError, ValueError):
+            raise SourceFileError("The " + SHARD_INDEX_TITLE + " sheet has an invalid row: {}".format(row))
+
+    shards = list(dict.fromkeys(location for location, _, _, _ in runs))
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs > 1 and len(shards) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(shards)), initializer=initialise_metrics_worker,
+                                 initargs=(stage_metrics.enabled,)) as executor:
+            futures = [executor.submit(run_measured, read_encoded_shard, path, shard_workbook or filename,
+                                       worksheet_title)
+                       for worksheet_title, shard_workbook in shards]
+            shard_data = []
+            for future in futures:
+                encoded, worker_metrics = future.result()
+                stage_metrics.merge(worker_metrics)
+                shard_data.append(decode_sheet_data(encoded))
+    else:
+        shard_data = [read_shard(path, shard_workbook, worksheet_title, None if shard_workbook else workbook)
+                      for worksheet_title, shard_workbook in shards]
+
+    languages = shard_data[0].languages if shard_data else []
+    # Shards are named by their workbook when they have one, as every shard workbook's worksheet has the same title.
+    names = [shard_workbook or worksheet_title for worksheet_title, shard_workbook in shards]
+    for name, data in zip(names, shard_data):
+        if data.languages != languages:
+            raise SourceFileError("Shard {} has different language headings to the first shard.".format(name))
+
+    shard_indices = {location: index for index, location in enumerate(shards)}
+    positions = [0] * len(shards)
+    rows = []
+    # Rows placed by an order, keyed by their original worksheet row.
+    ordered_rows = {}
+    ordered_count = 0
+    for location, first_row, last_row, order in runs:
+        index = shard_indices[location]
+        end = positions[index] + last_row - first_row + 1
+        if end > len(shard_data[index].rows):
+            raise SourceFileError("Shard {} has fewer rows than the {} sheet lists.".
+                                  format(names[index], SHARD_INDEX_TITLE))
+        if order is None:
+            rows.extend(shard_data[index].rows[positions[index]:end])
+        else:
+            original_rows = [original_row for first, last in order for original_row in range(first, last + 1)]
+            if len(original_rows) != end - positions[index]:
+                raise SourceFileError("The {} sheet lists an order of {} rows for a run of {} rows of shard {}.".
+                                      format(SHARD_INDEX_TITLE, len(original_rows), end - positions[index],
+                                             names[index]))
+            ordered_rows.update(zip(original_rows, shard_data[index].rows[positions[index]:end]))
+            ordered_count += len(original_rows)
+        positions[index] = end
+
+    if ordered_rows:
+        # Worksheet rows are one based and follow the heading row.
+        if rows or len(ordered_rows) != ordered_count or \
+                sorted(ordered_rows) != list(range(2, ordered_count + 2)):
+            raise SourceFileError("The {} sheet's orders do not list every row exactly once.".
+                                  format(SHARD_INDEX_TITLE))
+        rows = [ordered_rows[original_row] for original_row in range(2, len(ordered_rows) + 2)]
+
+    for name, data, position in zip(names, shard_data, positions):
+        if position != len(data.rows):
+            raise SourceFileError("Shard {} has rows that the {} sheet does not list.".format(name, SHARD_INDEX_TITLE))
+    logger.info("{} shards merged in {} runs.".format(len(shards), len(runs)))
+    return SheetData(languages, rows)
+
+
+def read_shard(path, filename, worksheet_title, workbook=None):
+    """ Read Shard
+
+    :param path:            User provided path of Excel file.
+    :param filename:        Filename of the shard's workbook, ignored if workbook is given.
+    :param worksheet_title: Title of the shard's worksheet.
+    :param workbook:        Optional open workbook holding the shard, if None the shard's workbook is opened.
+    :return:                SheetData of the shard's worksheet.
+    """
+    if workbook is not None:
+        return read_worksheet_rows(get_excel_worksheet(workbook, worksheet_title))
+    shard_workbook = read_excel_file(path, filename)
+    try:
+        # Every shard workbook's worksheet has the same title, so its rows are reported under the workbook's name.
+        return read_worksheet_rows(get_excel_worksheet(shard_workbook, worksheet_title),
+                                   "{} {}".format(filename, worksheet_title))
+    finally:
+        shard_workbook.close()
+
+
+def read_encoded_shard(path, filename, worksheet_title):
+    """ Read Encoded Shard
+
+    Worker process entry point of read_sharded_rows, returning the shard in the compact form used by the parsed
+    workbook cache so that it is cheap to hand back to the main process.
+
+    :param path:            User provided path of Excel file.
+    :param filename:        Filename of the shard's workbook.
+    :param worksheet_title: Title of the shard's worksheet.
+    :return:                Bytes created by encode_sheet_data.
+    """
+    return encode_sheet_data(read_shard(path, filename, worksheet_title))
+
+
+def get_shard_file_paths(file_path):
+    """ Get Shard File Paths
+
+    :param file_path:   Path of an Excel file.
+    :return:            Sorted paths of the shard workbooks saved beside it by --shard-workbooks.
+    """
+    directory = os.path.dirname(file_path) or "."
+    prefix = strip_excel_extension(os.path.basename(file_path)) + "."
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return [os.path.join(directory, name) for name in sorted(names)
+            if name.startswith(prefix) and SHARD_FILE_PATTERN.search(name) and
+            name[len(prefix):].count(".") == 1]
+
+
+def read_cached_sheet_data(path, filename, cache_path, cache_size, jobs=1):
+    """ Read Cached Sheet Data
+
+    Returns the SheetData of the Excel file from the parsed workbook cache when an entry exists for the file's exact
+    contents, otherwise reads the Excel file and stores its SheetData in the cache. Entries are keyed by a hash of
+    the file's contents, the hash being reused while the file's size and modification time are unchanged, so edited
+    files are never served stale data. Shard workbooks saved beside the file are hashed with it. The cache is bounded
+    in size, least recently used entries being removed first.
+
+    :param path:        User provided path of Excel file.
+    :param filename:    Filename of Excel file.
+    :param cache_path:  Directory of the parsed workbook cache.
+    :param cache_size:  Maximum size of the parsed workbook cache in megabytes.
+    :param jobs:        Number of worker processes reading the shards of a sharded workbook, 0 uses every CPU.
+    :return:            SheetData read from the cache or the worksheet.
+    """
+    if '.xlsx' not in filename:
+        file_path = os.path.join(path, "{}.xlsx".format(filename))
+    else:
+        file_path = os.path.join(path, filename)
+    if not os.path.isfile(file_path):
+        return read_sheet_data(path, filename, jobs)
+
+    entry_path = None
+    try:
+        if not os.path.exists(cache_path):
+            os.makedirs(cache_path)
+        workbook_hash = get_workbook_hash(file_path, cache_path)
+        shard_paths = get_shard_file_paths(file_path)
+        if shard_paths:
+            workbook_hash = hashlib.sha256(":".join([workbook_hash] + [get_workbook_hash(shard_path, cache_path)
+                                                                        for shard_path in shard_paths])
+                                           .encode('utf-8')).hexdigest()
+        entry_path = os.path.join(cache_path, workbook_hash + CACHE_ENTRY_EXTENSION)
+        with open(entry_path, 'rb') as entry:
+            sheet_data = decode_sheet_data(entry.read())
+        os.utime(entry_path)
+        logger.info("Parsed workbook cache hit for: {}".format(file_path))
+        return sheet_data
+    except (FileNotFoundError, ValueError, EOFError, TypeError, zlib.error):
+        logger.info("Parsed workbook cache miss for: {}".format(file_path))
+    except OSError as exception:
+        logger.warning("Parsed workbook cache at: {} could not be used: {}".format(cache_path, repr(exception)))
+        return read_sheet_data(path, filename, jobs)
+
+    sheet_data = read_sheet_data(path, filename, jobs)
+    if entry_path is None:
+        return sheet_data
+    try:
+        write_file_atomically(entry_path, encode_sheet_data(sheet_data))
+        evict_cache_entries(cache_path, cache_size * 1024 * 1024)
+    except (OSError, ValueError) as exception:
+        logger.warning("Parsed workbook could not be cached: {}".format(repr(exception)))
+    return sheet_data
+
+
+def get_workbook_hash(file_path, cache_path):
+    """ Get Workbook Hash
+
+    Returns the hash of the Excel file's contents. Hashes are remembered in the cache index against the file's path,
+    size and modification time, so an unchanged file is not read again.
+
+    :param file_path:   Path of the Excel file.
+    :param cache_path:  Directory of the parsed workbook cache.
+    :return:            Hex digest identifying the file's contents.
+    """
+    status = os.stat(file_path)
+    absolute_path = os.path.abspath(file_path)
+    index_path = os.path.join(cache_path, CACHE_INDEX_TITLE)
+    try:
+        with open(index_path, 'r', encoding='utf-8') as index_file:
+            index = json.load(index_file)
+    except (FileNotFoundError, ValueError):
+        index = {}
+
+    entry = index.get(absolute_path)
+    if entry is not None and entry.get("size") == status.st_size and entry.get("mtime") == status.st_mtime_ns:
+        return entry["hash"]
+
+    workbook_hash = hashlib.sha256("{}:{}".format(CACHE_VERSION, sys.version_info[:2]).encode('utf-8'))
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            workbook_hash.update(chunk)
+    index[absolute_path] = {"size": status.st_size, "mtime": status.st_mtime_ns, "hash": workbook_hash.hexdigest()}
+    write_file_atomically(index_path, json.dumps(index, indent=2, sort_keys=True).encode('utf-8'))
+    return index[absolute_path]["hash"]
+
+
+def encode_sheet_data(sheet_data):
+    """ Encode Sheet Data
+
+    Encodes SheetData into a compact, compressed, columnar binary form: the type, modifier and key columns followed by
+    one column per language and the sheet and row number each row was read from, rather than one record per row.
+
+    :param sheet_data:  SheetData read from the worksheet.
+    :return:            Encoded bytes.
+    """
+    rows = sheet_data.rows
+    language_columns = [[row.values[index] for row in rows] for index in range(len(sheet_data.languages))]
+    columns = (CACHE_VERSION, list(sheet_data.languages), [row.element_type for row in rows],
+               [row.modifiers for row in rows], [row.key for row in rows], language_columns,
+               [row.sheet for row in rows], [row.row for row in rows])
+    return zlib.compress(marshal.dumps(columns))
+
+
+def decode_sheet_data(encoded):
+    """ Decode Sheet Data
+
+    :param encoded:     Bytes created by encode_sheet_data.
+    :return:            SheetData.
+    """
+    columns = marshal.loads(zlib.decompress(encoded))
+    if columns[0] != CACHE_VERSION:
+        raise ValueError("Cache entry version {} is not supported.".format(columns[0]))
+    _, languages, element_types, modifiers, keys, language_columns, sheets, row_numbers = columns
+    if language_columns:
+        values = zip(*language_columns)
+    else:
+        values = (() for _ in element_types)
+    rows = [SheetRow(intern_value(element_type), intern_modifiers(modifier), key, row_values, intern_value(sheet),
+                     row_number)
+            for element_type, modifier, key, row_values, sheet, row_number in zip(element_types, modifiers, keys,
+                                                                                  values, sheets, row_numbers)]
+    return SheetData(languages, rows)
+
+
+def evict_cache_entries(cache_path, max_bytes):
+    """ Evict Cache Entries
+
+    Removes the least recently used cache entries until the cache fits within max_bytes.
+
+    :param cache_path:  Directory of the parsed workbook cache.
+    :param max_bytes:   Maximum total size of the cache entries.
+    """
+    entries = []
+    for entry_name in os.listdir(cache_path):
+        if entry_name.endswith(CACHE_ENTRY_EXTENSION):
+            status = os.stat(os.path.join(cache_path, entry_name))
+            entries.append((status.st_mtime, status.st_size, entry_name))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, entry_name in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        os.remove(os.path.join(cache_path, entry_name))
+        total_bytes -= size
+        logger.info("Parsed workbook cache entry evicted: {}".format(entry_name))
+
+
+def write_file_atomically(file_path, content):
+    """ Write File Atomically
+
+    Writes the bytes to a temporary file beside file_path and then renames it into place, so readers never see a
+    partially written file.
+
+    :param file_path:   Path of the file to write.
+    :param content:     Bytes to write.
+    """
+    def write(temporary_path):
+        with open(temporary_path, 'wb') as file:
+            file.write(content)
+
+    save_atomically(file_path, write)
+
+
+def save_atomically(file_path, save):
+    """ Save Atomically
+
+    Calls save with the path of a temporary file beside file_path and then renames the file into place. If save fails
+    or the run is cancelled (Ctrl-C) part way through, the temporary file is removed and any existing file at
+    file_path is left as it was.
+
+    :param file_path:   Path of the file to write.
+    :param save:        Function given the temporary path, which writes the whole file to it.
+    :return:            save's return value.
+    """
+    temporary_path = "{}.{}.tmp".format(file_path, os.getpid())
+    try:
+        result = save(temporary_path)
+        os.replace(temporary_path, file_path)
+        return result
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
 
 
 def get_excel_worksheet(workbook, worksheet_title):
@@ -265,33 +2010,179 @@ def get_excel_worksheet(workbook, worksheet_title):
         logger.info("\"{}\" sheet successfully loaded from Excel file.".format(worksheet_title))
         return worksheet
 
-    except KeyError:
-        logger.error("Was unable to find " + worksheet_title + " in Excel file.")
-        exit(1)
+    except KeyError:
+        raise SourceFileError("Was unable to find " + worksheet_title + " in Excel file.")
+    except Exception as exception:
+        error_string_one = str(repr(exception))
+        error_string_two = str(exception.args)
+        error_string_three = str(traceback.format_exc())
+        logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
+        raise SourceFileError("There was an error while reading " + worksheet_title + " sheet from Excel file.")
+
+
+@measure_stage("read_worksheet_rows", lambda sheet_data, *args: len(sheet_data.rows))
+def read_worksheet_rows(worksheet, sheet=None):
+    """ Read Worksheet Rows
+
+    Walks the parsed worksheet once, top to bottom, and materialises a compact row model that is shared by every
+    language. Only language columns with a heading are kept and entirely empty rows are dropped.
+
+    :param worksheet:   openPyXl worksheet (read-only or standard).
+    :param sheet:       Name the rows are reported under, defaults to the worksheet's title.
+    :return:            SheetData containing the language headings and a SheetRow for each populated row.
+    """
+    try:
+        return build_sheet_data(worksheet.iter_rows(values_only=True), sheet or worksheet.title)
+
+    except Exception as exception:
+        error_string_one = str(repr(exception))
+        error_string_two = str(exception.args)
+        error_string_three = str(traceback.format_exc())
+        logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
+        raise SourceFileError("There was an error while reading rows from " + WORKSHEET_TITLE + " sheet.")
+
+
+def build_sheet_data(row_iterator, sheet=None):
+    """ Build Sheet Data
+
+    Materialises SheetData from an iterator of row value tuples, the first being the headings. Only language columns
+    with a heading are kept and entirely empty rows are dropped.
+
+    :param row_iterator:    Iterator of row tuples, empty cells being None.
+    :param sheet:           Name of the sheet or file the rows are read from, kept on each SheetRow with its row number.
+    :return:                SheetData containing the language headings and a SheetRow for each populated row.
+    """
+    headings = next(row_iterator, ())
+    language_columns = [index for index in range(FIRST_LANGUAGE_COLUMN, len(headings))
+                        if headings[index] is not None]
+    languages = [str(headings[index]) for index in language_columns]
+
+    rows = []
+    progress = ProgressReporter("read_worksheet_rows")
+    for row_number, row in enumerate(row_iterator, 2):
+        if not any(value is not None for value in row):
+            continue
+        if len(rows) > progress.next_check:
+            progress.update(len(rows))
+        row_length = len(row)
+        element_type = intern_value(row[0]) if row_length > 0 else None
+        key = row[2] if row_length > 2 else None
+        if element_type == "item":
+            # Plurals quantities repeat on every plurals element.
+            key = intern_value(key)
+        rows.append(SheetRow(element_type,
+                             decode_modifiers(row[1]) if row_length > 1 else None,
+                             key,
+                             tuple(row[index] if index < row_length else None for index in language_columns),
+                             sheet, row_number))
+
+    return SheetData(languages, rows)
+
+
+@measure_stage("read_delimited_file", lambda sheet_data, *args: len(sheet_data.rows))
+def read_delimited_file(path, filename, file_format):
+    """ Read Delimited File
+
+    Reads a CSV or TSV file laid out like the deconstructed worksheet straight into SheetData, without openPyXl.
+    Empty cells are read as None, as they are from a worksheet.
+
+    :param path:            User provided path of the file.
+    :param filename:        Filename of the file, with or without its extension.
+    :param file_format:     FORMAT_CSV or FORMAT_TSV.
+    :return:                SheetData containing the language headings and a SheetRow for each populated row.
+    """
+    file_path = get_delimited_file_path(path, DESTINATION_STRING_NOT_DEFINED, filename, file_format)
+    try:
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as file:
+            reader = csv.reader(file, dialect=DELIMITED_DIALECTS[file_format])
+            return build_sheet_data((tuple(value if value != "" else None for value in row) for row in reader),
+                                    os.path.basename(file_path))
+
+    except FileNotFoundError:
+        raise SourceNotFoundError("Was unable to find " + os.path.basename(file_path) + " in provided path: " +
+                                  path)
+    except Exception as exception:
+        error_string_one = str(repr(exception))
+        error_string_two = str(exception.args)
+        error_string_three = str(traceback.format_exc())
+        logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
+        raise SourceFileError("There was an error during processing the parsed " + os.path.basename(file_path) +
+                              " file.")
+
+
+@measure_stage("write_delimited_file", lambda rows, *args: rows)
+def write_delimited_file(xml_elements, file_path, file_format, locale_columns=None, dedup=False):
+    """ Write Delimited File
+
+    Streams the headings and every XML element row straight into a CSV or TSV file, using the same column layout as
+    the deconstructed worksheet. Empty cells are written as empty fields.
+
+    :param xml_elements:    The XML elements that have been taken from the parsed strings.xml.
+    :param file_path:       Path of the file to write.
+    :param file_format:     FORMAT_CSV or FORMAT_TSV.
+    :param locale_columns:  Optional LocaleColumns written after the English column.
+    :param dedup:           If true, strings with identical text and modifiers share a row, see dedup_rows.
+    :return rows:           Number of element rows written.
+    """
+    def write(temporary_path):
+        rows = 0
+        with open(temporary_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file, dialect=DELIMITED_DIALECTS[file_format])
+            writer.writerow(get_headings(locale_columns))
+            for row in derive_worksheet_rows(xml_elements, locale_columns, dedup):
+                writer.writerow(row)
+                rows += 1
+        return rows
+
+    try:
+        rows = save_atomically(file_path, write)
+        logger.info("All XML elements successfully written to {} file.".format(file_format.upper()))
+        return rows
+
+    except TranslationStringsError:
+        raise
     except Exception as exception:
         error_string_one = str(repr(exception))
         error_string_two = str(exception.args)
         error_string_three = str(traceback.format_exc())
         logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
-        logger.error("There was an error while reading " + worksheet_title + " sheet from Excel file.")
-        exit(1)
+        raise OutputFileError("There was an error while writing the {} file at: {}".
+                              format(file_format.upper(), file_path))
+
+
+def get_delimited_file_path(source_path, destin_path, filename, file_format):
+    """ Get Delimited File Path
+
+    Determines the path of a CSV or TSV file, adding the format's extension when it is missing.
+
+    :param source_path:    User provided source path.
+    :param destin_path:    User provided destination path.
+    :param filename:       Filename, with or without its extension.
+    :param file_format:    FORMAT_CSV or FORMAT_TSV.
+    :return:               Full path of the file.
+    """
+    extension = ".{}".format(file_format)
+    if not filename.endswith(extension):
+        filename = "{}{}".format(filename, extension)
+
+    if destin_path == DESTINATION_STRING_NOT_DEFINED:
+        return os.path.join(source_path, filename)
+    return os.path.join(destin_path, filename)
 
 
-def create_folders(worksheet, columns, source_path, destin_path):
+def create_folders(languages, source_path, destin_path):
     """ Create Folders
 
     Creates folders required to store the string.xml files.
 
-    :param worksheet:       opnePyXl worksheet.
-    :param columns:         The total number of columns in worksheet
+    :param languages:       Language headings taken from the worksheet.
     :param source_path:     Source directory of Excel file.
     :param destin_path:     Destination directory where where folders should be created (if mode is application).
-    :return return_index:   Index of last valid column in worksheet.
+    :return directories:    The directory created for each language, in the same order as languages.
     """
-    return_index = 0
-    for column in range(3, columns):
+    directories = []
+    for language in languages:
         try:
-            language = worksheet["{}1".format(get_column_value(column))].value
             if destin_path == DESTINATION_STRING_NOT_DEFINED:
                 directory = r"{}".format(os.path.join(source_path, language))
             else:
@@ -301,70 +2192,506 @@ def create_folders(worksheet, columns, source_path, destin_path):
                 logger.info("New folder: {}, created at: {}".format(language, directory))
             else:
                 logger.info("{} folder already exists at: {}".format(language, directory))
-            return_index = column
-        except TypeError:
-            pass
+            directories.append(directory)
         except Exception as exception:
             error_string_one = str(repr(exception))
             error_string_two = str(exception.args)
             error_string_three = str(traceback.format_exc())
             logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
-            logger.error(
+            raise OutputFileError(
                 "There was an error while trying to detect/create the required directory to store output files")
-            exit(1)
-    return return_index
+    return directories
 
 
-def populate_worksheet(xml_elements, worksheet):
+def populate_worksheet(xml_elements, worksheet, locale_columns=None, dedup=False):
     """" Populate Workbook
 
-    Populates a openPyXl workbook with all XML elements.
+    Populates a openPyXl workbook with all XML elements, measuring the longest value in each of columns A-C as it
+    goes so that they can be sized without being read back (see adjust_column_width).
 
-    :param xml_elements:   The XML elements that have been taken from the parsed strings.xml.
-    :param worksheet:      The openPyXl worksheet that is to be populated with the XML elements.
-    :return worksheet:     Same worksheet parsed to function but now containing all XML elements.
+    :param xml_elements:    The XML elements that have been taken from the parsed strings.xml.
+    :param worksheet:       The openPyXl worksheet that is to be populated with the XML elements.
+    :param locale_columns:  Optional LocaleColumns written after the English column.
+    :param dedup:           If true, strings with identical text and modifiers share a row, see dedup_rows.
+    :return column_lengths: Length of the longest value written to each of columns A-C.
+    """
+    return populate_worksheet_rows(derive_worksheet_rows(xml_elements, locale_columns, dedup), worksheet)
+
+
+@measure_stage("populate_worksheet", lambda column_lengths, rows, worksheet, *args: worksheet.max_row - 1)
+def populate_worksheet_rows(rows, worksheet):
+    """ Populate Worksheet Rows
+
+    Writes the worksheet rows below the heading row, see populate_worksheet.
+
+    :param rows:            Iterable of worksheet row tuples, see derive_worksheet_rows.
+    :param worksheet:       The openPyXl worksheet that is to be populated.
+    :return column_lengths: Length of the longest value written to each of columns A-C.
     """
     try:
+        column_lengths = [0] * FIRST_LANGUAGE_COLUMN
+        progress = ProgressReporter("populate_worksheet", len(rows) if isinstance(rows, list) else None)
         excel_row_index = 1
-        for element in xml_elements:
+        for row in rows:
             excel_row_index += 1
-            populate_cell(worksheet, excel_row_index, CellType.cell_type, element.tag)
-            child_elements = list(element)
-            # XML element has no child elements.
-            if len(child_elements) == 0:
-                populate_cell(worksheet, excel_row_index, CellType.key, element.attrib["name"])
-                populate_cell(worksheet, excel_row_index, CellType.string, element.text)
+            if excel_row_index > progress.next_check:
+                progress.update(excel_row_index - 1)
+            for cell_type, value in zip(CellType, row):
+                if value is not None:
+                    populate_cell(worksheet, excel_row_index, cell_type, value)
+            for column, value in enumerate(row[len(CellType):], len(CellType) + 1):
+                if value is not None:
+                    worksheet.cell(row=excel_row_index, column=column, value=value)
+            for index in range(FIRST_LANGUAGE_COLUMN):
+                if row[index] is not None and len(row[index]) > column_lengths[index]:
+                    column_lengths[index] = len(row[index])
+        logger.info("All XML elements successfully loaded into Excel worksheet.")
+
+        return column_lengths
+    except TranslationStringsError:
+        raise
+    except Exception as exception:
+        error_string_one = str(repr(exception))
+        error_string_two = str(exception.args)
+        error_string_three = str(traceback.format_exc())
+        logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
+        raise SourceFileError("There was an error during processing the parsed " + XML_TITLE + " file.")
+
+
+def derive_worksheet_rows(xml_elements, locale_columns=None, dedup=False):
+    """ Derive Worksheet Rows
+
+    Generator that turns the XML elements into worksheet rows, one at a time. Each row is a tuple ordered as the
+    CellType columns (type, modifiers, key, string), followed by the text of each locale, with None for any cell that
+    should be left empty.
+
+    :param xml_elements:    The XML elements that have been taken from the parsed strings.xml.
+    :param locale_columns:  Optional LocaleColumns joined to the rows, see join_locale_rows.
+    :param dedup:           If true, strings with identical text and modifiers share a row, see dedup_rows.
+    :return:                Generator of worksheet row tuples.
+    """
+    rows = decode_xml_elements(xml_elements)
+    if locale_columns is not None:
+        rows = join_locale_rows(rows, locale_columns)
+    if dedup:
+        rows = dedup_rows(rows)
+    for row in rows:
+        yield (row.element_type, encode_modifiers(row.modifiers), row.key) + row.values
+
+
+def decode_xml_elements(xml_elements):
+    """ Decode XML Elements
+
+    Generator that decodes the XML elements into SheetRow records, one at a time, holding the element's single
+    language in values. The records are the same ones construction reads from a spreadsheet, so any output format can
+    be written from them.
+
+    :param xml_elements:   The XML elements that have been taken from the parsed strings.xml.
+    :return:               Generator of SheetRow records.
+    """
+    for element in xml_elements:
+        tag = intern_value(element.tag)
+        # XML element has no child elements.
+        if len(element) == 0:
+            yield SheetRow(tag, None, element.attrib["name"], (element.text,))
+        # Element is string-array or plurals
+        elif tag == "plurals" or tag == "string-array":
+            yield SheetRow(tag, None, element.attrib["name"], (None,))
+            for item in element:
+                key = intern_value(item.attrib["quantity"]) if tag == "plurals" else None
+                modifiers, ui_string = derive_modifiers_and_string(item)
+                yield SheetRow(intern_value(item.tag), modifiers, key, (ui_string,))
+        # Element is a string with modifiers (<b></b>, <u></u>, etc).
+        else:
+            modifiers, ui_string = derive_modifiers_and_string(element)
+            yield SheetRow(tag, modifiers, element.attrib["name"], (ui_string,))
+
+
+def identify_rows(rows):
+    """ Identify Rows
+
+    Generator that pairs each SheetRow with an identity that is the same in every locale's strings.xml file: the
+    element type and key for strings, string-arrays and plurals, the plurals key and quantity for plurals items and
+    the string-array key and position for string-array items.
+
+    :param rows:    Generator of SheetRow records, in file order.
+    :return:        Generator of (identity, SheetRow) tuples.
+    """
+    group_type = None
+    group_key = None
+    position = 0
+    for row in rows:
+        if row.element_type == "item":
+            if group_type == "plurals":
+                identity = (group_type, group_key, row.key)
+            else:
+                identity = (group_type, group_key, position)
+                position += 1
+        else:
+            identity = (row.element_type, row.key)
+            group_type = row.element_type
+            group_key = row.key
+            position = 0
+        yield identity, row
+
+
+def join_locale_rows(rows, locale_columns):
+    """ Join Locale Rows
+
+    Generator that appends each locale's text to the base file's SheetRow records, looking every row up once in each
+    locale's index. Plurals quantities that only locales have (e.g. French "many") are added as extra items at the end
+    of their plurals, with no base text, as languages need different quantities. Other entries a locale has that the
+    base file does not are counted and reported once the join completes.
+
+    :param rows:            Generator of the base file's SheetRow records.
+    :param locale_columns:  LocaleColumns read by read_locale_columns.
+    :return:                Generator of SheetRow records holding the base text followed by each locale's text.
+    """
+    indices = locale_columns.indices
+    matched = [0] * len(indices)
+
+    # Quantities of each plurals found in the locales, in the order first found.
+    locale_quantities = {}
+    for index in indices:
+        for identity in index:
+            if identity[0] == "plurals" and len(identity) == 3:
+                quantities = locale_quantities.setdefault(identity[1], [])
+                if identity[2] not in quantities:
+                    quantities.append(identity[2])
+
+    def locale_only_items(group_key, base_quantities):
+        for quantity in locale_quantities.get(group_key, ()):
+            if quantity in base_quantities:
+                continue
+            identity = ("plurals", group_key, quantity)
+            modifiers = None
+            values = [None]
+            for index_number, index in enumerate(indices):
+                entry = index.get(identity)
+                if entry is not None:
+                    matched[index_number] += 1
+                    if modifiers is None:
+                        modifiers = entry[0]
+                values.append(entry[1] if entry is not None else None)
+            yield SheetRow(intern_value("item"), modifiers, intern_value(quantity), tuple(values))
+
+    plurals_key = None
+    base_quantities = set()
+    for identity, row in identify_rows(rows):
+        if plurals_key is not None and identity[:2] != ("plurals", plurals_key):
+            yield from locale_only_items(plurals_key, base_quantities)
+            plurals_key = None
+        if identity[0] == "plurals":
+            if len(identity) == 2:
+                plurals_key = identity[1]
+                base_quantities = set()
+            else:
+                base_quantities.add(identity[2])
+
+        values = list(row.values)
+        for index_number, index in enumerate(indices):
+            entry = index.get(identity)
+            if entry is not None:
+                matched[index_number] += 1
+            values.append(entry[1] if entry is not None else None)
+        yield row._replace(values=tuple(values))
+    if plurals_key is not None:
+        yield from locale_only_items(plurals_key, base_quantities)
+
+    for language, index, count in zip(locale_columns.languages, indices, matched):
+        if len(index) > count:
+            logger.warning("{} entries in {}/{} are not in the base file and have been skipped.".
+                           format(len(index) - count, language, XML_TITLE))
+
+
+def dedup_rows(rows):
+    """ Dedup Rows
+
+    Folds strings with identical modifiers and text, in every language, into the row of the first one found. A hash
+    table maps each string's (modifiers, values) to its row, and the keys of later duplicates are added to that row's
+    key, joined by KEY_ALIAS_SEPARATOR, so that the sheet holds one row per unique string. build_xml_tree writes the
+    row once for each of its keys. string-array and plurals items are never folded, as they have no key of their own.
+    As a row's keys are only known once every row has been read, the rows are held in memory.
+
+    :param rows:    Generator of SheetRow records, in file order.
+    :return:        List of SheetRow records, each unique string's keys joined into its key.
+    """
+    unique_rows = []
+    canonical_rows = {}
+    aliases = {}
+    for row in rows:
+        if row.element_type == "string" and row.values[0] is not None:
+            signature = (row.modifiers, row.values)
+            position = canonical_rows.get(signature)
+            if position is not None:
+                aliases.setdefault(position, [unique_rows[position].key]).append(row.key)
+                continue
+            canonical_rows[signature] = len(unique_rows)
+        unique_rows.append(row)
+
+    folded = 0
+    for position, keys in aliases.items():
+        unique_rows[position] = unique_rows[position]._replace(key=KEY_ALIAS_SEPARATOR.join(keys))
+        folded += len(keys) - 1
+    logger.info("{} duplicate strings folded into {} unique strings.".format(folded, len(canonical_rows)))
+    return unique_rows
+
+
+@measure_stage("stream_worksheet", lambda rows, *args: rows)
+def stream_worksheet(xml_elements, worksheet, style=STYLE_FULL, locale_columns=None, dedup=False):
+    """ Stream Worksheet
+
+    Writes the headings and every XML element row straight into a write-only openPyXl worksheet, with the same
+    styling that style_worksheet applies, so that no row is held in memory once written. Rows are written one behind
+    the reader, as the final row can only be given its bottom border once it is known to be last. Column widths are
+    fixed, as write-only sheets need them before the first row is written.
+
+    :param xml_elements:    The XML elements that have been taken from the parsed strings.xml.
+    :param worksheet:       Write-only openPyXl worksheet.
+    :param style:           Amount of styling to apply, STYLE_NONE, STYLE_FAST or STYLE_FULL.
+    :param locale_columns:  Optional LocaleColumns written after the English column.
+    :param dedup:           If true, strings with identical text and modifiers share a row, see dedup_rows. The rows
+                            are then held in memory until every key is known.
+    :return:                Number of element rows written.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    try:
+        headings = get_headings(locale_columns)
+        width = len(headings)
+
+        if style == STYLE_NONE:
+            worksheet.append(headings)
+            rows = 0
+            for row in derive_worksheet_rows(xml_elements, locale_columns, dedup):
+                worksheet.append(row)
+                rows += 1
+            logger.info("All XML elements successfully streamed into Excel worksheet.")
+            return rows
+
+        set_fixed_column_widths(worksheet, width)
+        cell_styles = create_cell_styles(worksheet.parent, HEADING_COLOUR, FILL_COLOUR, style == STYLE_FULL)
+
+        def styled_row(values, style_row, row_position):
+            zebra = style_row != 0 and style_row % 2 == 0
+            cells = []
+            for style_col in range(width):
+                cell = WriteOnlyCell(worksheet, value=values[style_col] if style_col < len(values) else None)
+                cell.style = cell_styles[(row_position, get_border_column_position(style_col, width), zebra,
+                                          style_col >= FIRST_LANGUAGE_COLUMN)]
+                cells.append(cell)
+            return cells
+
+        pending_row = headings
+        style_row = 0
+        for row in derive_worksheet_rows(xml_elements, locale_columns, dedup):
+            worksheet.append(styled_row(pending_row, style_row, "heading" if style_row == 0 else "body"))
+            pending_row = row
+            style_row += 1
+        worksheet.append(styled_row(pending_row, style_row, "heading" if style_row == 0 else "bottom"))
+
+        logger.info("All XML elements successfully streamed into Excel worksheet.")
+        return style_row
+
+    except TranslationStringsError:
+        raise
+    except Exception as exception:
+        error_string_one = str(repr(exception))
+        error_string_two = str(exception.args)
+        error_string_three = str(traceback.format_exc())
+        logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
+        raise SourceFileError("There was an error during processing the parsed " + XML_TITLE + " file.")
+
+
+def index_worksheet_rows(worksheet):
+    """ Index Worksheet Rows
+
+    Reads columns A-D of the worksheet once and builds a hash index from each row's identity to its row number,
+    modifiers and source string. Strings, string-arrays and plurals are identified by their type and key, plurals
+    items by their parent and quantity, and string-array items by their parent and position within it. A
+    deduplicated row (see dedup_rows) is indexed under each of its keys.
+
+    :param worksheet:       openPyXl worksheet.
+    :return row_index:      Dictionary of row identity to (row number, modifiers, source string).
+    :return group_ends:     Dictionary of string-array/plurals identity to the row number of its last row.
+    :return last_row:       Row number of the last populated row.
+    """
+    row_index = {}
+    group_ends = {}
+    last_row = 1
+    parent = None
+    ordinal = 0
+    for row_number, row in enumerate(worksheet.iter_rows(min_row=2, max_col=FIRST_LANGUAGE_COLUMN + 1,
+                                                         values_only=True), 2):
+        row_type, modifiers, key, text = row
+        if row_type is None:
+            continue
+        last_row = row_number
+        if row_type == "item":
+            if parent is None:
+                continue
+            ordinal += 1
+            identity = (parent, str(key) if parent[0] == "plurals" else ordinal)
+            group_ends[parent] = row_number
+        else:
+            identity = (row_type, str(key))
+            parent = identity if row_type in ("string-array", "plurals") else None
+            ordinal = 0
+            if parent is not None:
+                group_ends[parent] = row_number
+            elif KEY_ALIAS_SEPARATOR in identity[1]:
+                for alias in identity[1].split(KEY_ALIAS_SEPARATOR):
+                    row_index[(row_type, alias)] = (row_number, modifiers, text)
+                continue
+        row_index[identity] = (row_number, modifiers, text)
+    return row_index, group_ends, last_row
+
+
+def merge_worksheet(xml_elements, worksheet):
+    """ Merge Worksheet
+
+    Merges the XML elements into an existing worksheet in a single linear pass over the strings.xml rows, using the
+    index built by index_worksheet_rows. Rows whose modifiers or source string changed are updated in columns B and D
+    and flagged with a comment, new string-array and plurals items are inserted at the end of their group, other new
+    elements are appended to the bottom of the sheet and rows no longer in strings.xml are flagged with a comment.
+    The key of a deduplicated row (see dedup_rows) whose string changed is moved to a new row at the bottom of the
+    sheet, wherever it is in the row's keys, and a removed key is dropped from the row unless all of its keys are
+    gone, in which case the row is flagged. Translation columns (E onward) are never written and untouched rows keep
+    their values and styling.
+
+    :param xml_elements:   The XML elements that have been taken from the parsed strings.xml.
+    :param worksheet:      The openPyXl worksheet created by an earlier deconstruction.
+    :return worksheet:     Same worksheet, now merged with the XML elements.
+    """
+    from openpyxl.comments import Comment
+    try:
+        row_index, group_ends, last_row = index_worksheet_rows(worksheet)
+        width = worksheet.max_column
+
+        seen = set()
+        group_inserts = {}
+        appended_rows = []
+        updated = 0
+        split = 0
+        parent = None
+        ordinal = 0
+
+        for row in derive_worksheet_rows(xml_elements):
+            row_type, modifiers, key, text = row
+            if row_type == "item":
+                ordinal += 1
+                identity = (parent, key if parent[0] == "plurals" else ordinal)
             else:
-                populate_cell(worksheet, excel_row_index, CellType.key, element.attrib["name"])
-                # Element is string-array or plurals
-                if element.tag == "plurals" or element.tag == "string-array":
-                    for item in child_elements:
-                        excel_row_index += 1
-                        populate_cell(worksheet, excel_row_index, CellType.cell_type, item.tag)
-                        if element.tag == "plurals":
-                            populate_cell(worksheet, excel_row_index, CellType.key, item.attrib["quantity"])
-                        # Element has no string modifiers
-                        if len(item) == 0:
-                            populate_cell(worksheet, excel_row_index, CellType.string, item.text)
-                        else:
-                            mod_string, ui_string = derive_modifiers_and_string(item)
-                            populate_cell(worksheet, excel_row_index, CellType.modifier, mod_string)
-                            populate_cell(worksheet, excel_row_index, CellType.string, ui_string)
-                # Element is a string with modifiers (<b></b>, <u></u>, etc).
+                identity = (row_type, key)
+                parent = identity if row_type in ("string-array", "plurals") else None
+                ordinal = 0
+
+            existing = row_index.get(identity)
+            if existing is None:
+                if row_type == "item" and parent in row_index:
+                    group_inserts.setdefault(group_ends[parent], []).append(row)
                 else:
-                    mod_string, ui_string = derive_modifiers_and_string(element)
-                    populate_cell(worksheet, excel_row_index, CellType.modifier, mod_string)
-                    populate_cell(worksheet, excel_row_index, CellType.string, ui_string)
-        logger.info("All XML elements successfully loaded into Excel worksheet.")
+                    appended_rows.append(row)
+                continue
+
+            seen.add(identity)
+            row_number, existing_modifiers, existing_text = existing
+            if existing_modifiers != modifiers or existing_text != text:
+                key_cell = worksheet.cell(row=row_number, column=CellType.key.value + 1)
+                keys = str(key_cell.value).split(KEY_ALIAS_SEPARATOR)
+                # A key of a deduplicated row whose string changed is given a row of its own, leaving the row's
+                # other keys with their unchanged string and translations.
+                if len(keys) > 1 and key in keys:
+                    keys.remove(key)
+                    key_cell.value = KEY_ALIAS_SEPARATOR.join(keys)
+                    appended_rows.append(row)
+                    split += 1
+                    continue
+                # Assigned rather than passed to cell(), which ignores None, so that removed modifiers are cleared.
+                worksheet.cell(row=row_number, column=CellType.modifier.value + 1).value = modifiers
+                string_cell = worksheet.cell(row=row_number, column=CellType.string.value + 1)
+                string_cell.value = text
+                string_cell.comment = Comment(MERGE_UPDATED_COMMENT, MERGE_COMMENT_AUTHOR)
+                updated += 1
+
+            key_cell = worksheet.cell(row=row_number, column=CellType.key.value + 1)
+            if key_cell.comment is not None and key_cell.comment.text == MERGE_REMOVED_COMMENT:
+                key_cell.comment = None
+
+        # Keys no longer in strings.xml, by row, as a deduplicated row is indexed once for each of its keys.
+        missing_keys = {}
+        for identity, (row_number, _, _) in row_index.items():
+            if identity not in seen:
+                missing_keys.setdefault(row_number, set()).add(identity[1] if identity[0] == "string" else None)
+
+        removed = 0
+        stripped = 0
+        for row_number, missing in missing_keys.items():
+            key_cell = worksheet.cell(row=row_number, column=CellType.key.value + 1)
+            keys = str(key_cell.value).split(KEY_ALIAS_SEPARATOR)
+            remaining = [alias for alias in keys if alias not in missing]
+            # Removed keys of a deduplicated row whose other keys remain are dropped from its key cell, so that they
+            # are no longer constructed. The row is only flagged once all of its keys are gone.
+            if None not in missing and len(keys) > 1 and remaining:
+                key_cell.value = KEY_ALIAS_SEPARATOR.join(remaining)
+                stripped += len(keys) - len(remaining)
+            else:
+                key_cell.comment = Comment(MERGE_REMOVED_COMMENT, MERGE_COMMENT_AUTHOR)
+                removed += 1
+
+        # Open a gap after each group that gained items, moving each block of rows once, from the bottom up.
+        insert_positions = sorted(group_inserts)
+        shift = sum(len(rows) for rows in group_inserts.values())
+        block_end = last_row
+        for position in reversed(insert_positions):
+            if position < block_end:
+                worksheet.move_range("A{}:{}{}".format(position + 1, get_column_value(width - 1), block_end),
+                                     rows=shift)
+            shift -= len(group_inserts[position])
+            block_end = position
+
+        inserted = 0
+        for position in insert_positions:
+            for row in group_inserts[position]:
+                inserted += 1
+                write_merged_row(worksheet, position + inserted, row, width)
+        for offset, row in enumerate(appended_rows, 1):
+            write_merged_row(worksheet, last_row + inserted + offset, row, width)
+
+        logger.info("Merge complete: {} rows unchanged, {} updated, {} inserted, {} flagged as removed, {} removed "
+                    "keys dropped from deduplicated rows.".
+                    format(len(seen) - updated - split, updated, inserted + len(appended_rows), removed, stripped))
 
         return worksheet
+    except TranslationStringsError:
+        raise
     except Exception as exception:
         error_string_one = str(repr(exception))
         error_string_two = str(exception.args)
         error_string_three = str(traceback.format_exc())
         logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
-        logger.error("There was an error during processing the parsed " + XML_TITLE + " file.")
-        exit(1)
+        raise SourceFileError("There was an error while merging " + XML_TITLE + " into the existing Excel file.")
+
+
+def write_merged_row(worksheet, row_number, row, width):
+    """ Write Merged Row
+
+    Writes a new row produced by a merge and copies the styling of the row two above it, so that the new row matches
+    the zebra striping of its neighbours.
+
+    :param worksheet:   openPyXl worksheet.
+    :param row_number:  The row index to write.
+    :param row:         Worksheet row tuple, ordered as the CellType columns.
+    :param width:       Number of styled columns.
+    """
+    for cell_type, value in zip(CellType, row):
+        if value is not None:
+            populate_cell(worksheet, row_number, cell_type, value)
+    template_row = row_number - 2 if row_number > 3 else row_number - 1
+    if template_row > 1:
+        for column in range(1, width + 1):
+            template_cell = worksheet.cell(row=template_row, column=column)
+            if template_cell.has_style:
+                worksheet.cell(row=row_number, column=column)._style = copy(template_cell._style)
 
 
 def populate_cell(worksheet, row, cell_type, value):
@@ -378,18 +2705,8 @@ def populate_cell(worksheet, row, cell_type, value):
     :param cell_type:   CellType Enum instance that describes the type of cell and therefore it's X co-ordinate.
     :param value:       The value to be written.
     """
-    if cell_type == CellType.cell_type:
-        co_ordinate = "A{}".format(row)
-        worksheet[co_ordinate] = value
-    elif cell_type == CellType.modifier:
-        co_ordinate = "B{}".format(row)
-        worksheet[co_ordinate] = value
-    elif cell_type == CellType.key:
-        co_ordinate = "C{}".format(row)
-        worksheet[co_ordinate] = value
-    elif cell_type == CellType.string:
-        co_ordinate = "D{}".format(row)
-        worksheet[co_ordinate] = value
+    if isinstance(cell_type, CellType):
+        worksheet.cell(row=row, column=cell_type.value + 1, value=value)
     else:
         logger.warning("Unrecognised type for XML element: {}".format(row))
 
@@ -417,122 +2734,219 @@ def is_deepest_item(element):
     :param element:     Parsed XML element.
     :returns            boolean
     """
-    if len(list(element)) == 0:
-        return True
-    else:
-        return False
+    return len(element) == 0
 
 
 def derive_modifiers_and_string(item):
     """ Derive Modifiers and String
 
-    At this point it is assumed that the parsed XML element is a UI string with some modifiers (<b></b>, <u></u>,
-    etc). This function move through all XML layers while building a csv string that describes the XML modifiers
-    that are found. At the deepest layer, the UI string is taken and both string are then returned
+    Moves down through the XML element's layers of modifiers (<b></b>, <u></u>, etc) in a single pass, collecting the
+    tag of each, and takes the UI string from the deepest layer. If any layer holds more than one element, text
+    beside its element or an element with attributes, the content cannot be described by a chain of modifiers and is
+    kept as markup instead, so that no text is dropped.
 
-    :param item:                Parsed XML element.
-    :return modifiers_string:   CSV string that describe UI string modifiers.
-    :return ui_string:          The UI string.
+    :param item:            Parsed XML element.
+    :return modifiers:      Interned tuple of modifier tags, outermost first, MARKUP_MODIFIERS or None if the element
+                            has none.
+    :return ui_string:      The UI string, or the element's inner XML if modifiers is MARKUP_MODIFIERS.
     """
-    number_of_layers = 0
-    modifiers_string = ""
-    ui_string = ""
-    base_layer_found = False
+    modifiers = []
     current_level = item
+    while len(current_level):
+        child = current_level[0]
+        if len(current_level) > 1 or child.attrib or not is_blank(current_level.text) or not is_blank(child.tail):
+            return intern_modifiers(MARKUP_MODIFIERS), serialise_inner_xml(item, trim_indentation=True)
+        modifiers.append(get_prefixed_name(child.tag))
+        current_level = child
 
-    while not base_layer_found:
-        number_of_layers += 1
-        if is_deepest_item(current_level):
-            base_layer_found = True
-        else:
-            current_level = list(current_level)[0]
+    if not modifiers:
+        return None, current_level.text
+    return intern_modifiers(tuple(modifiers)), current_level.text
 
-    current_level = item
 
-    for index in range(number_of_layers):
-        if index == 1:
-            modifiers_string += current_level.tag
-        elif index > 1:
-            modifiers_string += ",{}".format(current_level.tag)
+def is_blank(text):
+    """ Is Blank
+
+    :param text:    Element text or tail, or None.
+    :return:        True if text is None or only whitespace, such as the indentation between pretty printed elements.
+    """
+    return text is None or text.isspace()
+
+
+def decode_modifiers(modifier_string):
+    """ Decode Modifiers
+
+    Turns a worksheet modifier string (e.g. "b,i") into its interned tuple of modifier tags, so that every row with the
+    same modifiers shares a single tuple.
+
+    :param modifier_string:     Comma separated modifier tags, or None.
+    :return:                    Interned tuple of modifier tags, or None.
+    """
+    if modifier_string is None:
+        return None
+    modifiers = _modifier_cache.get(modifier_string)
+    if modifiers is None:
+        modifiers = intern_modifiers(tuple(str(modifier_string).split(",")))
+        _modifier_cache[modifier_string] = modifiers
+    return modifiers
+
+
+def intern_modifiers(modifiers):
+    """ Intern Modifiers
+
+    :param modifiers:   Tuple of modifier tags, or None.
+    :return:            The shared tuple equal to modifiers, made of interned tags, or None.
+    """
+    if modifiers is None:
+        return None
+    interned = _modifier_cache.get(modifiers)
+    if interned is None:
+        interned = tuple(sys.intern(modifier) for modifier in modifiers)
+        _modifier_cache[interned] = interned
+    return interned
+
+
+def encode_modifiers(modifiers):
+    """ Encode Modifiers
+
+    :param modifiers:   Tuple of modifier tags, or None.
+    :return:            Comma separated modifier string as written to the worksheet, or None.
+    """
+    if modifiers is None:
+        return None
+    return ",".join(modifiers)
 
-        if index == number_of_layers-1:
-            ui_string = current_level.text
-        else:
-            current_level = list(current_level)[0]
 
-    return modifiers_string, ui_string
+def intern_value(value):
+    """ Intern Value
+
+    :param value:   A cell value.
+    :return:        The interned string if value is a string, else value unchanged.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
 
 
-def style_worksheet(worksheet):
+@measure_stage("style_worksheet", lambda result, worksheet, *args: worksheet.max_row - 1)
+def style_worksheet(worksheet, style=STYLE_FULL, headings=HEADINGS, column_lengths=None):
     """ Style Worksheet
 
-    Calls multiple functions to style the parsed worksheet.
+    Calls multiple functions to style the parsed worksheet. STYLE_NONE only writes the headings, STYLE_FAST colours
+    the sheet using fixed column widths and STYLE_FULL also applies borders and fits columns to their contents.
 
-    :param worksheet:   Parsed openPyXl worksheet.
-    :returns worksheet: Worksheet has now been styled.
+    :param worksheet:       Parsed openPyXl worksheet.
+    :param style:           Amount of styling to apply, STYLE_NONE, STYLE_FAST or STYLE_FULL.
+    :param headings:        Column headings, see get_headings.
+    :param column_lengths:  Optional lengths returned by populate_worksheet, if None columns A-C are measured.
+    :returns worksheet:     Worksheet has now been styled.
     """
-    build_headings(worksheet)
-    adjust_column_width(worksheet)
-    apply_borders_and_colour(worksheet, "90CAF9", "BBDEFB")
+    build_headings(worksheet, headings)
+
+    if style == STYLE_NONE:
+        logger.info("Styling skipped, only headings applied to Excel file.")
+        return
+
+    if style == STYLE_FULL:
+        adjust_column_width(worksheet, column_lengths)
+    else:
+        set_fixed_column_widths(worksheet, worksheet.max_column)
+    apply_borders_and_colour(worksheet, HEADING_COLOUR, FILL_COLOUR, style == STYLE_FULL)
 
     logger.info("Style elements successfully applied to Excel file.")
 
 
-def build_headings(worksheet):
+def build_headings(worksheet, headings=HEADINGS):
     """ Build Headings
 
-    Prints hardcoded headings onto the openPyXl worksheet.
+    Prints the headings onto the openPyXl worksheet.
 
     :param worksheet:   openPyXl worksheet.
+    :param headings:    Column headings, see get_headings.
     :return:
     """
-    worksheet['A1'] = "XML Element Type"
-    worksheet['B1'] = "String Style Modifiers"
-    worksheet['C1'] = "XML Element Key"
-    worksheet['D1'] = "English"
-    worksheet['E1'] = "French"
-    worksheet['F1'] = "Spanish"
+    for index, heading in enumerate(headings):
+        worksheet.cell(row=1, column=index + 1, value=heading)
 
     logger.info("Headings successfully applied to Excel file.")
 
 
-def adjust_column_width(worksheet):
+def get_headings(locale_columns=None):
+    """ Get Headings
+
+    :param locale_columns:  Optional LocaleColumns read by read_locale_columns.
+    :return:                The default headings, or if there are locale columns, the element columns followed by the
+                            base folder and each locale folder, so that construction recreates the res folder layout.
+    """
+    if locale_columns is None:
+        return HEADINGS
+    return HEADINGS[:FIRST_LANGUAGE_COLUMN] + [BASE_VALUES_DIRECTORY] + locale_columns.languages
+
+
+def adjust_column_width(worksheet, column_lengths=None):
     """ Adjust Column Width
 
-    Iterates through each column and adjusts the width to ensure there is no text overlap in worksheet. All language
-    are set to a fixed width and configured to wrap text.
+    Sizes columns A-C to fit their longest value and heading, so there is no text overlap in the worksheet. Every
+    language column is set to a fixed width and given a column-level wrapped text style, so no empty cells are created.
 
-    :param worksheet:   openPyXl worksheet.
+    :param worksheet:       openPyXl worksheet.
+    :param column_lengths:  Optional lengths returned by populate_worksheet, if None columns A-C are measured.
     :return:
     """
-    for index in range(3):
-        col = worksheet[get_column_value(index)]
-        max_length = 0
-        column = col[0].column
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except TypeError:
-                pass
-            except Exception:
-                logger.warning("An error has occurred during styling spreadsheet, this may affect its appearance.")
-                pass
-        adjusted_width = (max_length + 2)
-        worksheet.column_dimensions[column].width = adjusted_width
+    from openpyxl.styles import Alignment
+    if column_lengths is None:
+        column_lengths = measure_column_lengths(worksheet)
+
+    for index, length in enumerate(column_lengths):
+        heading = worksheet.cell(row=1, column=index + 1).value
+        if heading is not None:
+            length = max(length, len(str(heading)))
+        worksheet.column_dimensions[get_column_value(index)].width = length + 2
 
     wrap_alignment = Alignment(wrap_text=True)
-    for index in range(3, 30):
-        col = worksheet[get_column_value(index)]
-        column = col[0].column
-        worksheet.column_dimensions[column].width = 50
-        for cell in col:
-            cell.alignment = wrap_alignment
+    for index in range(FIRST_LANGUAGE_COLUMN, max(worksheet.max_column, LAST_STYLED_COLUMN)):
+        column_dimension = worksheet.column_dimensions[get_column_value(index)]
+        column_dimension.width = LANGUAGE_COLUMN_WIDTH
+        column_dimension.alignment = wrap_alignment
 
     logger.info("Excel column widths adjusted.")
 
 
-def apply_borders_and_colour(worksheet, heading_colour, fill_colour):
+def measure_column_lengths(worksheet):
+    """ Measure Column Lengths
+
+    Reads columns A-C of a worksheet that was not filled by populate_worksheet to find the length of their longest
+    value.
+
+    :param worksheet:       openPyXl worksheet.
+    :return column_lengths: Length of the longest value in each of columns A-C, headings excluded.
+    """
+    column_lengths = []
+    for col in worksheet.iter_cols(min_col=1, max_col=FIRST_LANGUAGE_COLUMN, min_row=2, max_row=worksheet.max_row,
+                                   values_only=True):
+        column_lengths.append(max((len(str(value)) for value in col if value is not None), default=0))
+    return column_lengths
+
+
+def set_fixed_column_widths(worksheet, width):
+    """ Set Fixed Column Widths
+
+    Sets columns A-C to fixed widths and every language column to the standard language width, without reading any
+    cell values.
+
+    :param worksheet:   openPyXl worksheet (standard or write-only).
+    :param width:       Number of columns to size.
+    :return:
+    """
+    for index in range(width):
+        if index < len(FIXED_COLUMN_WIDTHS):
+            column_width = FIXED_COLUMN_WIDTHS[index]
+        else:
+            column_width = LANGUAGE_COLUMN_WIDTH
+        worksheet.column_dimensions[get_column_value(index)].width = column_width
+
+
+def apply_borders_and_colour(worksheet, heading_colour, fill_colour, borders=True):
     """ Apply Borders and Colour
 
     Applies borders and coluring to the parsed openPyXl worksheet.
@@ -540,222 +2954,612 @@ def apply_borders_and_colour(worksheet, heading_colour, fill_colour):
     :param worksheet:       openPyXl worksheet.
     :param heading_colour:  String describing the hex code of the colour used to fill spreadsheet headings.
     :param fill_colour:     String describing the hex code of the colour used to fill spreadsheet body.
+    :param borders:         If false, only colours, fonts and wrapping are applied.
     :return:
     """
 
     height = worksheet.max_row
     width = worksheet.max_column
+    cell_styles = create_cell_styles(worksheet.parent, heading_colour, fill_colour, borders)
+    progress = ProgressReporter("apply_borders_and_colour", height)
+
+    for style_row, row in enumerate(worksheet.iter_rows(min_row=1, max_row=height, min_col=1, max_col=width)):
+        if style_row > progress.next_check:
+            progress.update(style_row)
+        row_position = get_border_row_position(style_row, height)
+        zebra = style_row != 0 and style_row % 2 == 0
+        for style_col, style_cell in enumerate(row):
+            style_cell.style = cell_styles[(row_position, get_border_column_position(style_col, width), zebra,
+                                            style_col >= FIRST_LANGUAGE_COLUMN)]
+    logger.info("Borders and colour successfully applied to Excel file.")
 
-    for style_col in range(width):
-        column = get_column_value(style_col)
-        style_cell_name = "{}{}".format(column, 1)
-        worksheet[style_cell_name].font = Font(size=11, bold=True, color='FF424242')
 
-    for style_col in range(width):
-        column = get_column_value(style_col)
-        for style_row in range(height):
-            style_cell_name = "{}{}".format(column, style_row + 1)
-            style_cell = worksheet[style_cell_name]
+def create_cell_styles(workbook, heading_colour, fill_colour, borders=True):
+    """ Create Cell Styles
 
-            if style_row != 0:
-                if style_row % 2 == 0:
-                    style_cell.fill = PatternFill("solid", fgColor=fill_colour)
-            else:
-                style_cell.fill = PatternFill("solid", fgColor=heading_colour)
-
-            if style_row == 0 and style_col == 0:
-                style_cell.border = Border(left=Side(border_style="thick", color='FF000000'),
-                                           right=Side(border_style="thin", color='FF000000'),
-                                           top=Side(border_style="thick", color='FF000000'),
-                                           bottom=Side(border_style="thick", color='FF000000'))
-            elif style_row == 0 and style_col == width - 1:
-                style_cell.border = Border(left=Side(border_style="thin", color='FF000000'),
-                                           right=Side(border_style="thick", color='FF000000'),
-                                           top=Side(border_style="thick", color='FF000000'),
-                                           bottom=Side(border_style="thick", color='FF000000'))
-            elif style_row == 0:
-                style_cell.border = Border(left=Side(border_style="thin", color='FF000000'),
-                                           right=Side(border_style="thin", color='FF000000'),
-                                           top=Side(border_style="thick", color='FF000000'),
-                                           bottom=Side(border_style="thick", color='FF000000'))
-            elif style_row == height - 1 and style_col == 0:
-                style_cell.border = Border(left=Side(border_style="thick", color='FF000000'),
-                                           right=Side(border_style="thin", color='FF000000'),
-                                           bottom=Side(border_style="thick", color='FF000000'))
-            elif style_row == height - 1 and style_col == width - 1:
-                style_cell.border = Border(left=Side(border_style="thin", color='FF000000'),
-                                           right=Side(border_style="thick", color='FF000000'),
-                                           bottom=Side(border_style="thick", color='FF000000'))
-            elif style_row == height - 1:
-                style_cell.border = Border(left=Side(border_style="thin", color='FF000000'),
-                                           right=Side(border_style="thin", color='FF000000'),
-                                           bottom=Side(border_style="thick", color='FF000000'))
-            elif style_col == width - 1:
-                style_cell.border = Border(left=Side(border_style="thin", color='FF000000'),
-                                           right=Side(border_style="thick", color='FF000000'),
-                                           bottom=Side(border_style="dashed", color='FF000000'))
-            elif style_col == 0:
-                style_cell.border = Border(left=Side(border_style="thick", color='FF000000'),
-                                           right=Side(border_style="thin", color='FF000000'),
-                                           bottom=Side(border_style="dashed", color='FF000000'))
-            else:
-                style_cell.border = Border(left=Side(border_style="thin", color='FF000000'),
-                                           right=Side(border_style="thin", color='FF000000'),
-                                           bottom=Side(border_style="dashed", color='FF000000'))
-    logger.info("Borders and colour successfully applied to Excel file.")
+    Registers the small set of distinct cell styles used by the worksheet as named styles on the workbook, once, so
+    that each cell only needs to reference a style by name. Styles are keyed by row position ("heading", "body" or
+    "bottom"), column position ("left", "middle" or "right"), whether the row is a zebra (filled) row and whether the
+    cell is a wrapped language cell.
 
+    :param workbook:        openPyXl workbook the styles are registered on.
+    :param heading_colour:  String describing the hex code of the colour used to fill spreadsheet headings.
+    :param fill_colour:     String describing the hex code of the colour used to fill spreadsheet body.
+    :param borders:         If false, the styles carry no borders.
+    :return cell_styles:    Dictionary of named style names.
+    """
+    from openpyxl.styles import Alignment, PatternFill, Font, NamedStyle
+    from openpyxl.styles.fonts import DEFAULT_FONT
+    border_table = create_border_table()
+    heading_fill = PatternFill("solid", fgColor=heading_colour)
+    body_fill = PatternFill("solid", fgColor=fill_colour)
+    heading_font = Font(size=11, bold=True, color='FF424242')
+    wrap_alignment = Alignment(wrap_text=True)
+    existing_styles = set(workbook.named_styles)
+
+    cell_styles = {}
+    for row_position, col_position in border_table:
+        for zebra in (False, True):
+            for wrap in (False, True):
+                name = "Strings {} {}{}{}{}".format(row_position, col_position, " zebra" if zebra else "",
+                                                   " wrapped" if wrap else "", "" if borders else " borderless")
+                if name not in existing_styles:
+                    if row_position == "heading":
+                        fill = heading_fill
+                    elif zebra:
+                        fill = body_fill
+                    else:
+                        fill = None
+                    named_style = NamedStyle(name=name,
+                                             font=heading_font if row_position == "heading" else copy(DEFAULT_FONT),
+                                             fill=fill,
+                                             border=border_table[(row_position, col_position)] if borders else None,
+                                             alignment=wrap_alignment if wrap else None)
+                    workbook.add_named_style(named_style)
+                    existing_styles.add(name)
+                cell_styles[(row_position, col_position, zebra, wrap)] = name
+    return cell_styles
+
+
+def create_border_table():
+    """ Create Border Table
+
+    Creates the borders used by the styled worksheet once, keyed by the row position ("heading", "body" or "bottom")
+    and the column position ("left", "middle" or "right") of a cell.
+
+    :return borders:    Dictionary of openPyXl Border objects.
+    """
+    from openpyxl.styles import Border, Side
+    thick = Side(border_style="thick", color='FF000000')
+    thin = Side(border_style="thin", color='FF000000')
+    dashed = Side(border_style="dashed", color='FF000000')
+    borders = {}
+    for row_position, top, bottom in [("heading", thick, thick), ("body", None, dashed), ("bottom", None, thick)]:
+        borders[(row_position, "left")] = Border(left=thick, right=thin, top=top, bottom=bottom)
+        borders[(row_position, "middle")] = Border(left=thin, right=thin, top=top, bottom=bottom)
+        borders[(row_position, "right")] = Border(left=thin, right=thick, top=top, bottom=bottom)
+    return borders
+
+
+def get_border_row_position(row, height):
+    """ Get Border Row Position
+
+    Returns the row position used to look up a cell's border in the border table.
+
+    :param row:     Zero based row index of the cell.
+    :param height:  Number of styled rows.
+    :return:        "heading", "body" or "bottom".
+    """
+    if row == 0:
+        return "heading"
+    elif row == height - 1:
+        return "bottom"
+    return "body"
 
-def get_column_value(index):
+
+def get_border_column_position(column, width):
+    """ Get Border Column Position
+
+    Returns the column position used to look up a cell's border in the border table.
+
+    :param column:  Zero based column index of the cell.
+    :param width:   Number of styled columns.
+    :return:        "left", "middle" or "right".
     """
-    Takes a numerical column index and returns the alphabetical equivalent index suitable for Excel.
-    Determined by calculating the quotient and remainder of the index.
+    if column == 0:
+        return "left"
+    elif column == width - 1:
+        return "right"
+    return "middle"
+
+
+def create_column_letters(count):
+    """ Create Column Letters
 
-    Ex. Index 27 = AA
+    Builds the Excel column letters of the first "count" columns in order, i.e. A..Z, AA..AZ, ... ZZ, AAA...
 
-    :param index:   The column position of the next value to be written to an Excel cell
-    :return:        The Excel column position of the Excel cell where the value should be written
+    :param count:   Number of columns.
+    :return:        Tuple of column letters, indexed by zero based column index.
     """
-    try:
-        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        column_value = ""
-        result = "not yet populated"
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    letters = []
+    length = 1
+    while len(letters) < count:
+        letters.extend("".join(letter) for letter in itertools.product(alphabet, repeat=length))
+        length += 1
+    del letters[count:]
+    return tuple(letters)
+
+
+def get_column_value(index):
+    """ Get Column Value
 
-        result = int(math.modf(index / len(alphabet))[1])
-        if result > 0:
-            column_value += alphabet[result - 1]
-        column_value += alphabet[index % len(alphabet)]
+    Takes a zero based numerical column index and returns the alphabetical equivalent index suitable for Excel, looked
+    up in a table of every column's letters that is built once, on first use.
 
-        return column_value
-    except Exception as exp:
-        print("ERROR: result = {}, index = {}".format(result, index))
+    Ex. Index 26 = AA, index 16383 = XFD
+
+    :param index:   The zero based column position of an Excel cell.
+    :return:        The Excel column letters of the cell.
+    """
+    global _column_letters
+    if not 0 <= index < MAX_COLUMNS:
+        raise ValueError("Column index {} is outside of the {} columns supported by Excel.".format(index, MAX_COLUMNS))
+    if _column_letters is None:
+        _column_letters = create_column_letters(MAX_COLUMNS)
+    return _column_letters[index]
 
 
-def create_xml_file(worksheet, col_number, rows, xml_tree, path):
+@measure_stage("create_xml_file", lambda result, sheet_data, *args: len(sheet_data.rows))
+def create_xml_file(sheet_data, language_index, xml_tree, path):
     """ Create XML File
 
-    Using the parsed openPyXl worksheet and column number to create a strings.xml file in the language which that column
+    Using the parsed sheet data and language index to create a strings.xml file in the language which that column
     represents. The XML file is then stored at the parsed file path.
 
-    :param worksheet:   openPyXl worksheet.
-    :param col_number:  The column number of the language to be created.
-    :param rows:        The number of rows within the openPyXl worksheet
-    :param xml_tree:    The XML object to place the information into.
-    :param path:        The path where the output file is to be saved.
+    :param sheet_data:      SheetData read from the worksheet.
+    :param language_index:  Index of the language to be created within sheet_data.languages.
+    :param xml_tree:        The XML object to place the information into.
+    :param path:            The path where the output file is to be saved.
     :return:
     """
-    current_type = "string"
-    for row in range(2, rows):
-        modifier_string = worksheet["B{}".format(row)].value
-
-        # Update current element type ('item' falls under string-array or plural)
-        if worksheet["A{}".format(row)].value != "item":
-            current_type = worksheet["A{}".format(row)].value
-
-        if current_type == "string":
-            # String element with no modifiers
-            if modifier_string is None:
-                string_element = elementTree.Element('string')
-                string_element.set("name", str(worksheet["C{}".format(row)].value))
-                string_element.text = worksheet["{}{}".format(get_column_value(col_number), row)].value
-            # String element with string modifiers
-            else:
-                temp_value = str(worksheet["{}{}".format(get_column_value(col_number), row)].value)
-                string_element = create_modified_element("string", modifier_string.split(","),
-                                                         str(worksheet["C{}".format(row)].value), temp_value)
-            xml_tree.append(string_element)
+    build_xml_tree(sheet_data.rows, language_index, xml_tree)
+    save_xml_file(path, xml_tree)
+
+
+def build_xml_tree(rows, language_index, xml_tree):
+    """ Build XML Tree
 
-        elif str(worksheet["A{}".format(row)].value) == "item":
+    Walks the sheet rows once, appending an XML element to the parsed tree for each string, string-array and
+    plurals found in the language column. Nothing is serialised here, the tree is only written out once it is complete.
+
+    Empty cells of the first (base) language are written as empty strings and items, as an empty string in the default
+    strings.xml is still referenced by the app. Other languages leave out strings with no value and string-arrays
+    missing any item, never single items as that would shift the array's indices, so that Android falls back to the
+    default strings.xml for them. Plurals items with no value are left out in every language, as each language uses
+    its own quantities (see join_locale_rows), and so is a plurals left with no items.
+
+    :param rows:            SheetRow list read from the worksheet.
+    :param language_index:  Index of the language to be built within each row's values.
+    :param xml_tree:        The XML object to place the information into.
+    :return xml_tree:       Same XML object, now containing all elements for the language.
+    """
+    is_base = language_index == 0
+    current_type = "string"
+    multiple_item_element = None
+    missing_items = 0
+    for position, (row_type, modifiers, key, values, sheet, row_number) in enumerate(rows, 2):
+        key = str(key)
+        value = values[language_index]
+
+        if row_type != "item":
+            # The previous string-array or plurals is complete.
+            close_multiple_item_element(xml_tree, multiple_item_element, missing_items, is_base)
+            multiple_item_element = None
+            missing_items = 0
+            # Update current element type ('item' falls under string-array or plural)
+            current_type = row_type
+
+        if value is None and (row_type == "item" or current_type == "string"):
+            if row_type == "item" and current_type == "string-array":
+                missing_items += 1
+            if not is_base or current_type == "plurals":
+                continue
+
+        if row_type == "item":
             # UI string has no modifiers
-            if modifier_string is None:
+            if modifiers is None:
                 item_element = elementTree.Element("item")
-                item_element.text = worksheet["{}{}".format(get_column_value(col_number), row)].value
+                item_element.text = value
             # UI has modifiers and therefore need to nest UI string in modifier xml elements
             else:
-                temp_value = str(worksheet["{}{}".format(get_column_value(col_number), row)].value)
-                item_element = create_modified_element("item", modifier_string.split(","),
-                                                       str(worksheet["C{}".format(row)].value), temp_value)
-            multiple_item_element.append(item_element)
+                item_element = create_modified_element("item", modifiers, key, "" if value is None else str(value))
 
             # plural element, therefore need to add 'quantity' tag and value
             if current_type == "plurals":
-                item_element.set("quantity", str(worksheet["C{}".format(row)].value))
+                item_element.set("quantity", key)
 
-            #
-            if str(worksheet["A{}".format(row+1)].value) != "item" or row == rows-1:
-                xml_tree.append(multiple_item_element)
+            if multiple_item_element is not None:
+                multiple_item_element.append(item_element)
+            else:
+                logger.warning("Found \"item\" on row {} outside of a string-array or plurals element. Element has "
+                               "not been added.".format(get_row_location(sheet, row_number or position)))
+
+        elif current_type == "string":
+            # A deduplicated row is written once for each of its keys, see dedup_rows.
+            for string_key in key.split(KEY_ALIAS_SEPARATOR) if KEY_ALIAS_SEPARATOR in key else (key,):
+                # String element with no modifiers
+                if modifiers is None:
+                    string_element = elementTree.Element('string')
+                    string_element.set("name", string_key)
+                    string_element.text = value
+                # String element with string modifiers
+                else:
+                    string_element = create_modified_element("string", modifiers, string_key,
+                                                             "" if value is None else str(value))
+                xml_tree.append(string_element)
 
-        elif current_type == "string-array":
-            multiple_item_element = elementTree.Element('string-array')
-            multiple_item_element.set("name", str(worksheet["C{}".format(row)].value))
+        elif current_type == "string-array" or current_type == "plurals":
+            # Items are appended to this element as the following rows are read, and the element is added to the
+            # tree once they have all been read (see close_multiple_item_element).
+            multiple_item_element = elementTree.Element(current_type)
+            multiple_item_element.set("name", key)
 
-        elif current_type == "plurals":
-            multiple_item_element = elementTree.Element('plurals')
-            multiple_item_element.set("name", str(worksheet["C{}".format(row)].value))
         else:
-            logger.warning("Found unknown XML type: \"{}\" Element has not been added.".
-                           format(str(worksheet["{}1".format(get_column_value(row))].value)))
+            logger.warning("Found unknown XML type: \"{}\" Element has not been added.".format(current_type))
 
-        xml_string = elementTree.tostring(xml_tree)
+    close_multiple_item_element(xml_tree, multiple_item_element, missing_items, is_base)
+    declare_namespaces(xml_tree)
+    return xml_tree
 
-        xml = minidom.parseString(xml_string)
-        formatted_xml_string = xml.toprettyxml()
-        thing = 1
-    save_xml_file(path, xml_tree)
+
+def close_multiple_item_element(xml_tree, multiple_item_element, missing_items, is_base):
+    """ Close Multiple Item Element
+
+    Adds a string-array or plurals to the tree once all of its items have been read, see build_xml_tree.
+
+    :param xml_tree:                The XML object to place the element into.
+    :param multiple_item_element:   The string-array or plurals element, or None.
+    :param missing_items:           Number of the string-array's items with no value in the language.
+    :param is_base:                 True when building the first (base) language.
+    """
+    if multiple_item_element is None:
+        return
+    if is_base:
+        xml_tree.append(multiple_item_element)
+    elif missing_items and len(multiple_item_element):
+        logger.warning("string-array \"{}\" is only partly translated, {} of its items have no value. It has been "
+                       "left out so that the default string-array is used.".format(multiple_item_element.get("name"),
+                                                                                   missing_items))
+    elif len(multiple_item_element):
+        xml_tree.append(multiple_item_element)
 
 
 def create_modified_element(element_type, modifiers, key, text):
     """ Create Modified Element
 
-    Creates a XML element that contains string modifiers like <b></b>, <u></u>, etc.
+    Creates a XML element that contains string modifiers like <b></b>, <u></u>, etc, nesting one element per modifier
+    in a single pass. Markup (see derive_modifiers_and_string) is parsed back into the element's text and children,
+    or written as plain text if it is not well formed. The text of a markup element is never None, which keeps it on
+    one line when saved (see write_xml_element).
 
     :param element_type:    The type of XML element that is being created.
-    :param modifiers:       List of strings that describes modifiers
+    :param modifiers:       Tuple of modifier tags, outermost first, or MARKUP_MODIFIERS.
     :param key:             The key that should be used in element.
-    :param text:            The UI value of element
-    :return:
+    :param text:            The UI value of element, or its inner XML.
+    :return:                The XML element.
     """
     base_element = elementTree.Element(element_type)
     if element_type != "item":
         base_element.set("name", key)
-    number_of_modifiers = len(modifiers)
-    count = 1
+
+    if modifiers == MARKUP_MODIFIERS:
+        try:
+            markup_element = elementTree.fromstring("<{0} {1}>{2}</{0}>".format(
+                element_type, " ".join('xmlns:{}="{}"'.format(prefix, uri) for prefix, uri in XML_NAMESPACES.items()),
+                text))
+            for element in markup_element.iter():
+                element.tag = get_prefixed_name(element.tag)
+                if any(name[0] == "{" for name in element.attrib):
+                    element.attrib = {get_prefixed_name(name): value for name, value in element.attrib.items()}
+            base_element.text = markup_element.text or ""
+            base_element.extend(markup_element)
+        except elementTree.ParseError:
+            logger.warning("The markup of {} \"{}\" is not well formed and has been written as plain text.".
+                           format(element_type, key))
+            base_element.text = text
+        return base_element
+
+    current_level = base_element
     for modifier in modifiers:
-        if number_of_modifiers == 1:
-            modifier_element = elementTree.Element(modifier)
-            modifier_element.text = text
-        elif count == 1:
-            modifier_element = elementTree.Element(modifier)
-        elif count == number_of_modifiers:
-            child_element_list = list(modifier_element.iter())
-            last_element = elementTree.Element(modifier)
-            last_element.text = text
-            child_element_list.pop(len(child_element_list) - 1).append(last_element)
-        else:
-            child_element_list = list(modifier_element.iter())
-            elementTree.SubElement(child_element_list.pop(len(child_element_list) - 1), modifier)
-        count += 1
-    base_element.append(modifier_element)
+        current_level = elementTree.SubElement(current_level, modifier)
+    current_level.text = text
 
     return base_element
 
 
+@measure_stage("validate_sheet_data", lambda issues, sheet_data: len(sheet_data.rows))
+def validate_sheet_data(sheet_data):
+    """ Validate Sheet Data
+
+    Checks every row in a single pass, in the same order build_xml_tree walks them, for:
+        - keys used by more than one string, string-array or plurals, and plurals quantities used twice in one plurals.
+          Each key of a deduplicated row (see dedup_rows) is checked.
+        - strings and string-array items with no text in a language, and plurals with no quantity in a language. Each
+          language uses its own plurals quantities (see join_locale_rows), so single empty quantities are allowed.
+        - strings and items whose placeholders (%s, %1$s, %d...) differ from those of the first language.
+    Keys are checked against an index of the keys seen so far, and the placeholders of each distinct value are only
+    extracted once.
+
+    :param sheet_data:  SheetData read from the worksheet.
+    :return issues:     List of ValidationIssue, in row order.
+    """
+    languages = sheet_data.languages
+    issues = []
+    key_index = {}
+    placeholder_index = {}
+    group_key = None
+    current_type = "string"
+    # Location of the plurals being checked, where the issues its items are reported before, and its languages with
+    # at least one quantity.
+    plurals_location = None
+    plurals_languages = set()
+
+    for position, (row_type, _, key, values, sheet, row_number) in enumerate(sheet_data.rows, 2):
+        if row_number is None:
+            row_number = position
+        if row_type != "item":
+            if plurals_location is not None:
+                report_missing_plurals(issues, plurals_location, group_key, languages, plurals_languages)
+                plurals_location = None
+            if row_type == "plurals":
+                plurals_location = (len(issues), sheet, row_number)
+                plurals_languages = set()
+            current_type = row_type
+            group_key = key
+            if row_type in ("string-array", "plurals"):
+                identity = (row_type, key)
+            else:
+                identity = ("string", key)
+        elif current_type == "plurals":
+            identity = ("plurals", group_key, key)
+        else:
+            identity = None
+            # string-array items have no key of their own.
+            key = group_key
+
+        if identity is None:
+            identities = ()
+        elif identity[0] == "string" and KEY_ALIAS_SEPARATOR in str(key):
+            identities = [("string", alias) for alias in str(key).split(KEY_ALIAS_SEPARATOR)]
+        else:
+            identities = (identity,)
+        for identity in identities:
+            first_location = key_index.setdefault(identity, (sheet, row_number))
+            if first_location != (sheet, row_number):
+                issues.append(ValidationIssue(ISSUE_DUPLICATE_KEY, row_number, identity[-1], None,
+                                              "already used on row {}".format(get_row_location(*first_location)),
+                                              sheet))
+
+        # string-array and plurals rows only name their items.
+        if row_type != "item" and current_type != "string":
+            continue
+
+        source_placeholders = None
+        for language_index, value in enumerate(values):
+            if value is None or (value.strip() == "" if isinstance(value, str) else False):
+                if current_type != "plurals":
+                    issues.append(ValidationIssue(ISSUE_MISSING_TRANSLATION, row_number, key,
+                                                  languages[language_index], "no text", sheet))
+                continue
+            if current_type == "plurals":
+                plurals_languages.add(language_index)
+
+            if not isinstance(value, str) or "%" not in value:
+                placeholders = ()
+            else:
+                placeholders = placeholder_index.get(value)
+                if placeholders is None:
+                    placeholders = get_placeholders(value)
+                    placeholder_index[value] = placeholders
+
+            if language_index == 0:
+                source_placeholders = placeholders
+            elif source_placeholders is not None and placeholders != source_placeholders:
+                issues.append(ValidationIssue(ISSUE_PLACEHOLDER_MISMATCH, row_number, key, languages[language_index],
+                                              "{} has {}, {} has {}".format(
+                                                  languages[0], " ".join(source_placeholders) or "none",
+                                                  languages[language_index], " ".join(placeholders) or "none"),
+                                              sheet))
+
+    if plurals_location is not None:
+        report_missing_plurals(issues, plurals_location, group_key, languages, plurals_languages)
+    return issues
+
+
+def report_missing_plurals(issues, plurals_location, key, languages, plurals_languages):
+    """ Report Missing Plurals
+
+    Adds a missing translation issue for each language with no quantity of a plurals, placed before the issues of the
+    plurals' items so that the issues stay in row order.
+
+    :param issues:              List of ValidationIssue being built by validate_sheet_data.
+    :param plurals_location:    (position in issues, sheet, row number) of the plurals.
+    :param key:                 Key of the plurals.
+    :param languages:           Language headings.
+    :param plurals_languages:   Indices of the languages with at least one quantity of the plurals.
+    """
+    position, sheet, row_number = plurals_location
+    issues[position:position] = [ValidationIssue(ISSUE_MISSING_TRANSLATION, row_number, key, language, "no quantities",
+                                                 sheet)
+                                 for language_index, language in enumerate(languages)
+                                 if language_index not in plurals_languages]
+
+
+def get_row_location(sheet, row):
+    """ Get Row Location
+
+    :param sheet:   Name of the sheet or file the row was read from, or None.
+    :param row:     Row number within the sheet.
+    :return:        The row number, followed by the sheet's name in brackets if known, e.g. "5 (Deconstructed Strings)".
+    """
+    if sheet is None:
+        return str(row)
+    return "{} ({})".format(row, sheet)
+
+
+def get_placeholders(text):
+    """ Get Placeholders
+
+    Positional specifiers ("%1$s") may be reordered by a translation, so they are sorted, and are followed by the
+    other specifiers in the order they appear in text, as those are filled in turn.
+
+    :param text:    UI string.
+    :return:        Tuple of the format specifiers in text, ignoring escaped percent signs ("%%").
+    """
+    if "%" not in text:
+        return ()
+    placeholders = PLACEHOLDER_PATTERN.findall(text)
+    if "%%" in placeholders:
+        placeholders = [placeholder for placeholder in placeholders if placeholder != "%%"]
+    if len(placeholders) > 1:
+        placeholders = sorted(placeholder for placeholder in placeholders if "$" in placeholder) + \
+            [placeholder for placeholder in placeholders if "$" not in placeholder]
+    return tuple(placeholders)
+
+
+def hash_language_content(rows, language_index):
+    """ Hash Language Content
+
+    Hashes everything that determines a language's strings.xml file: the type, modifiers and key of every row along
+    with the language's own value. Changes to other language columns do not alter the hash.
+
+    :param rows:            SheetRow list read from the worksheet.
+    :param language_index:  Index of the language within each row's values.
+    :return:                Hex digest of the language's content.
+    """
+    content_hash = hashlib.sha256(str(MANIFEST_VERSION).encode('utf-8'))
+    for row in rows:
+        content_hash.update(repr((row.element_type, encode_modifiers(row.modifiers), row.key,
+                                  row.values[language_index])).
+                            encode('utf-8'))
+    return content_hash.hexdigest()
+
+
+def hash_file(file_path):
+    """ Hash File
+
+    :param file_path:   Path of the file to hash.
+    :return:            Hex digest of the file's bytes, or None if the file does not exist.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def read_manifest(path):
+    """ Read Manifest
+
+    Loads the construction manifest stored alongside the language folders. A missing, unreadable or out of date
+    manifest is treated as empty, so every language is constructed.
+
+    :param path:        Directory containing the language folders.
+    :return manifest:   Dictionary of language to its "content" and "file" hashes.
+    """
+    try:
+        with open(os.path.join(path, MANIFEST_TITLE), 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest["languages"]
+        logger.info("Construction manifest is from a different version of this tool and will be rebuilt.")
+    except FileNotFoundError:
+        logger.info("No construction manifest found at: {}, all languages will be constructed.".format(path))
+    except (ValueError, KeyError, AttributeError):
+        logger.warning("Construction manifest at: {} could not be read and will be rebuilt.".format(path))
+    return {}
+
+
+def is_language_current(manifest, language, content_hash, directory):
+    """ Is Language Current
+
+    Returns True if the language's content is unchanged since the manifest was written and its strings.xml file is
+    still exactly the file that was written, else False.
+
+    :param manifest:        Dictionary loaded by read_manifest.
+    :param language:        Language heading.
+    :param content_hash:    Hash of the language's current content.
+    :param directory:       The language's output directory.
+    :returns                boolean
+    """
+    entry = manifest.get(language)
+    if entry is None or entry.get("content") != content_hash:
+        return False
+    return entry.get("file") == hash_file(os.path.join(directory, XML_TITLE))
+
+
+def update_manifest(manifest, languages, directories, content_hashes):
+    """ Update Manifest
+
+    Records the content hash and output file hash of every language in the sheet. Languages that are no longer in
+    the sheet are dropped.
+
+    :param manifest:        Dictionary loaded by read_manifest, updated in place.
+    :param languages:       Language headings.
+    :param directories:     The output directory of each language.
+    :param content_hashes:  The content hash of each language.
+    :return manifest:       Same dictionary, now describing the current outputs.
+    """
+    for language in list(manifest):
+        if language not in languages:
+            del manifest[language]
+    for language, directory, content_hash in zip(languages, directories, content_hashes):
+        manifest[language] = {"content": content_hash, "file": hash_file(os.path.join(directory, XML_TITLE))}
+    return manifest
+
+
+def save_manifest(path, manifest):
+    """ Save Manifest
+
+    :param path:        Directory containing the language folders.
+    :param manifest:    Dictionary of language to its "content" and "file" hashes.
+    :return:
+    """
+    def write(temporary_path):
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump({"version": MANIFEST_VERSION, "languages": manifest}, file, indent=2, sort_keys=True)
+
+    try:
+        save_atomically(os.path.join(path, MANIFEST_TITLE), write)
+        logger.info("Construction manifest successfully saved at: {}".format(path))
+
+    except Exception as exception:
+        error_string_one = str(repr(exception))
+        error_string_two = str(exception.args)
+        error_string_three = str(traceback.format_exc())
+        logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
+        raise OutputFileError("There was an error while saving the construction manifest at: {} ".format(path))
+
+
+@measure_stage("save_xml_file", lambda result, path, xml_tree: len(xml_tree))
 def save_xml_file(path, xml_tree):
     """ Save XML File
 
-    Converts xml_tree into structured string and then saves as "strings.xml"
+    Streams xml_tree as tab indented, UTF-8 XML, one element at a time, into a temporary file that then replaces
+    "strings.xml", so that a failed or cancelled save never leaves a partially written file (see save_atomically).
 
     :param path:        The path where file should be saved.
     :param xml_tree:    XML object containing information to be saved.
     :return:
     """
-    try:
-        xml_string = elementTree.tostring(xml_tree)
+    def write(temporary_path):
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            file.write('<?xml version="1.0" ?>\n')
+            write_xml_element(file.write, xml_tree, "")
 
-        xml = minidom.parseString(xml_string)
-        formatted_xml_string = xml.toprettyxml()
-
-        with open(os.path.join(path, "strings.xml"), 'w', encoding='utf-8') as file:
-            file.write(formatted_xml_string)
+    try:
+        save_atomically(os.path.join(path, XML_TITLE), write)
 
         logger.info("strings.xml file successfully saved at: {}".format(path))
 
@@ -764,11 +3568,143 @@ def save_xml_file(path, xml_tree):
         error_string_two = str(exception.args)
         error_string_three = str(traceback.format_exc())
         logger.debug(error_string_one + "\n" + error_string_two + "\n" + error_string_three)
-        logger.error("There was an error while saving strings.xml file at: {} ".format(path))
-        exit(1)
+        raise OutputFileError("There was an error while saving strings.xml file at: {} ".format(path))
+
+
+def write_xml_element(write, element, indent):
+    """ Write XML Element
+
+    Writes the element and its children, indenting each by a further tab. The output is identical to serialising the
+    element with ElementTree and pretty printing it with minidom's toprettyxml, which the tool previously used: an
+    element whose only content is text is kept on one line, otherwise its text, children and their tails are each
+    written on their own line. The exceptions are mixed content (text beside child elements) and markup elements
+    created by create_modified_element, which are written on one line so that no whitespace is added to the string.
+
+    :param write:   Write function of the open file.
+    :param element: XML element to write.
+    :param indent:  Indentation of the element.
+    """
+    start_tag = indent + "<" + element.tag
+    for name, value in element.attrib.items():
+        start_tag += ' {}="{}"'.format(name, escape_xml_data(value))
+
+    text = element.text
+    if len(element) == 0:
+        if text:
+            write(start_tag + ">" + escape_xml_data(normalise_line_ends(text)) + "</" + element.tag + ">\n")
+        else:
+            write(start_tag + "/>\n")
+        return
+
+    if text is not None or any(child.tail for child in element):
+        write(start_tag + ">" + serialise_inner_xml(element) + "</" + element.tag + ">\n")
+        return
+
+    write(start_tag + ">\n")
+    child_indent = indent + "\t"
+    if text:
+        write(child_indent + escape_xml_data(normalise_line_ends(text)) + "\n")
+    for child in element:
+        write_xml_element(write, child, child_indent)
+        if child.tail:
+            write(child_indent + escape_xml_data(normalise_line_ends(child.tail)) + "\n")
+    write(indent + "</" + element.tag + ">\n")
+
+
+def serialise_inner_xml(element, trim_indentation=False):
+    """ Serialise Inner XML
+
+    :param element:             XML element.
+    :param trim_indentation:    If true, whitespace only text before the first child and after the last child, such
+                                as a pretty printed file's indentation, is left out.
+    :return:                    The element's text, children and their tails as escaped XML, without the element's
+                                own tags.
+    """
+    parts = []
+    if element.text and not (trim_indentation and is_blank(element.text)):
+        parts.append(escape_xml_data(normalise_line_ends(element.text)))
+    last_child = element[-1] if trim_indentation and len(element) else None
+    for child in element:
+        tag = get_prefixed_name(child.tag)
+        start_tag = "<" + tag
+        for name, value in child.attrib.items():
+            start_tag += ' {}="{}"'.format(get_prefixed_name(name), escape_xml_data(value))
+        content = serialise_inner_xml(child)
+        if content:
+            parts.append(start_tag + ">" + content + "</" + tag + ">")
+        else:
+            parts.append(start_tag + "/>")
+        if child.tail and not (child is last_child and is_blank(child.tail)):
+            parts.append(escape_xml_data(normalise_line_ends(child.tail)))
+    return "".join(parts)
+
+
+def get_prefixed_name(name):
+    """ Get Prefixed Name
+
+    :param name:    Element tag or attribute name, as parsed by ElementTree.
+    :return:        name with a namespace in XML_NAMESPACES written as its prefix, e.g. "{urn:...}g" as "xliff:g".
+    """
+    if name[0] != "{":
+        return name
+    uri, local_name = name[1:].split("}", 1)
+    prefix = NAMESPACE_PREFIXES.get(uri)
+    return name if prefix is None else prefix + ":" + local_name
+
+
+def declare_namespaces(xml_tree):
+    """ Declare Namespaces
+
+    Declares each namespace of XML_NAMESPACES whose prefix is used by an element or attribute in the tree on the
+    tree's root, as Android's strings.xml files do.
+
+    :param xml_tree:    XML object containing the built elements.
+    """
+    prefixes = set()
+    for element in xml_tree.iter():
+        if ":" in element.tag:
+            prefixes.add(element.tag.split(":", 1)[0])
+        for name in element.attrib:
+            if ":" in name:
+                prefixes.add(name.split(":", 1)[0])
+    for prefix in sorted(prefixes):
+        if prefix in XML_NAMESPACES:
+            xml_tree.set("xmlns:" + prefix, XML_NAMESPACES[prefix])
+
+
+def escape_xml_data(data):
+    """ Escape XML Data
+
+    :param data:    Text or attribute value.
+    :return:        data with &, <, " and > replaced by their entities.
+    """
+    if "&" in data:
+        data = data.replace("&", "&amp;")
+    if "<" in data:
+        data = data.replace("<", "&lt;")
+    if "\"" in data:
+        data = data.replace("\"", "&quot;")
+    if ">" in data:
+        data = data.replace(">", "&gt;")
+    return data
+
+
+def normalise_line_ends(text):
+    """ Normalise Line Ends
+
+    Replaces carriage returns in text with line feeds, as an XML parser does when the file is read back.
+
+    :param text:    Element text or tail.
+    :return:        text with "\\r\\n" and "\\r" replaced by "\\n".
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 if __name__ == '__main__':
+    configure_logging()
+    parser = create_parser()
     arguments = parser.parse_args()
     if len(sys.argv) >= 2:
         main(arguments)